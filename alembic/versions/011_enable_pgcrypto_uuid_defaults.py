@@ -0,0 +1,42 @@
+"""Enable pgcrypto and generate UUID primary keys server-side
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose id comes from Base.id (UUID, no per-model override)
+UUID_PK_TABLES = ('tenants', 'tenant_configs')
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built into PG13+, pgcrypto provides it on older versions
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+
+    for table_name in UUID_PK_TABLES:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    for table_name in UUID_PK_TABLES:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,37 @@
+"""Add composite (user_id, started_at DESC) indexes to call_logs
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_call_logs_user_started "
+            "ON call_logs (user_id, started_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_call_logs_user_status_started "
+            "ON call_logs (user_id, status, started_at DESC)"
+        )
+        # Covered by the composite indexes' leading column
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_call_logs_user_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_call_logs_user_id ON call_logs (user_id)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_call_logs_user_status_started")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_call_logs_user_started")
@@ -0,0 +1,35 @@
+"""Add composite (call_id, start_time_ms) index to call_transcript_logs
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transcript_call_time "
+            "ON call_transcript_logs (call_id, start_time_ms)"
+        )
+        # Covered by the composite index's leading column
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_call_transcript_logs_call_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_call_transcript_logs_call_id "
+            "ON call_transcript_logs (call_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transcript_call_time")
@@ -0,0 +1,62 @@
+"""Convert String(36) ids on call logs, global settings and phone numbers to native UUID
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose VARCHAR(36) primary key becomes a server-generated uuid
+UUID_PK_TABLES = ('call_logs', 'call_transcript_logs', 'global_settings', 'phone_numbers')
+
+TRANSCRIPT_FK = 'call_transcript_logs_call_id_fkey'
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # The FK has to go while both sides change type
+    op.execute(f"ALTER TABLE call_transcript_logs DROP CONSTRAINT IF EXISTS {TRANSCRIPT_FK}")
+
+    for table_name in UUID_PK_TABLES:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id TYPE uuid USING id::uuid")
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+    op.execute("ALTER TABLE call_transcript_logs ALTER COLUMN call_id TYPE uuid USING call_id::uuid")
+    op.execute(f"""
+        ALTER TABLE call_transcript_logs
+        ADD CONSTRAINT {TRANSCRIPT_FK}
+        FOREIGN KEY (call_id) REFERENCES call_logs(id) ON DELETE CASCADE
+    """)
+
+
+def downgrade() -> None:
+    op.execute(f"ALTER TABLE call_transcript_logs DROP CONSTRAINT IF EXISTS {TRANSCRIPT_FK}")
+
+    for table_name in UUID_PK_TABLES:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id DROP DEFAULT")
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id TYPE VARCHAR(36) USING id::text")
+
+    op.execute("ALTER TABLE call_transcript_logs ALTER COLUMN call_id TYPE VARCHAR(36) USING call_id::text")
+    op.execute(f"""
+        ALTER TABLE call_transcript_logs
+        ADD CONSTRAINT {TRANSCRIPT_FK}
+        FOREIGN KEY (call_id) REFERENCES call_logs(id) ON DELETE CASCADE
+    """)
@@ -0,0 +1,53 @@
+"""Store invitation emails as case-insensitive CITEXT
+
+"Customer" belongs to the storefront's Prisma schema and keeps its
+VARCHAR(255) email and lower(email) indexes; an earlier version of this
+revision converted it too, so that change is undone here.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+
+    if table_exists('invitations'):
+        op.execute("ALTER TABLE invitations ALTER COLUMN email TYPE citext")
+
+    # "Customer" is created by the storefront's Prisma schema
+    if table_exists('Customer'):
+        op.execute("""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'Customer' AND column_name = 'email'
+                      AND udt_name = 'citext'
+                ) THEN
+                    ALTER TABLE "Customer" ALTER COLUMN email TYPE VARCHAR(255);
+                END IF;
+            END $$
+        """)
+
+
+def downgrade() -> None:
+    if table_exists('invitations'):
+        op.execute("ALTER TABLE invitations ALTER COLUMN email TYPE VARCHAR(255)")
@@ -0,0 +1,93 @@
+"""Store document and invitation enums as VARCHAR with CHECK constraints
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> [(column, check constraint name, allowed values, old enum type, default)]
+ENUM_COLUMNS = {
+    'documents': [
+        ('status', 'ck_document_status',
+         ('pending', 'processing', 'completed', 'failed'), 'documentstatus', None),
+        ('doc_type', 'ck_document_doc_type',
+         ('pdf', 'txt', 'docx', 'url', 'manual'), 'documenttype', None),
+    ],
+    'invitations': [
+        ('status', 'ck_invitation_status',
+         ('pending', 'accepted', 'expired', 'revoked'), 'invitation_status_enum', 'pending'),
+        ('role', 'ck_invitation_role',
+         ('super_admin', 'admin', 'user'), 'user_role_enum', 'user'),
+    ],
+}
+
+# user_role_enum is still used by user_tenants.role
+DROPPED_TYPES = ('documentstatus', 'documenttype', 'invitation_status_enum')
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _in_list(values: tuple) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    for table_name, columns in ENUM_COLUMNS.items():
+        if not table_exists(table_name):
+            continue
+        for column, constraint, values, _, default in columns:
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} DROP DEFAULT")
+            # documents' enums were created by create_all with member names (PENDING)
+            op.execute(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} "
+                f"TYPE VARCHAR(20) USING lower({column}::text)"
+            )
+            if default:
+                op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} SET DEFAULT '{default}'")
+            op.execute(
+                f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint} "
+                f"CHECK ({column} IN ({_in_list(values)}))"
+            )
+
+    for type_name in DROPPED_TYPES:
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE TYPE invitation_status_enum AS ENUM ('pending', 'accepted', 'expired', 'revoked')"
+    )
+    op.execute("CREATE TYPE documentstatus AS ENUM ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED')")
+    op.execute("CREATE TYPE documenttype AS ENUM ('PDF', 'TXT', 'DOCX', 'URL', 'MANUAL')")
+
+    for table_name, columns in ENUM_COLUMNS.items():
+        if not table_exists(table_name):
+            continue
+        for column, constraint, _, enum_type, default in columns:
+            value = column if enum_type.startswith(('invitation', 'user_role')) else f"upper({column})"
+            op.execute(f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {constraint}")
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} DROP DEFAULT")
+            op.execute(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} "
+                f"TYPE {enum_type} USING {value}::{enum_type}"
+            )
+            if default:
+                op.execute(
+                    f"ALTER TABLE {table_name} ALTER COLUMN {column} "
+                    f"SET DEFAULT '{default}'::{enum_type}"
+                )
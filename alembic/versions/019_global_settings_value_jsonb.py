@@ -0,0 +1,33 @@
+"""Store global_settings.value as JSONB
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if table_exists('global_settings'):
+        op.execute("ALTER TABLE global_settings ALTER COLUMN value TYPE jsonb USING value::jsonb")
+
+
+def downgrade() -> None:
+    if table_exists('global_settings'):
+        op.execute("ALTER TABLE global_settings ALTER COLUMN value TYPE json USING value::json")
@@ -0,0 +1,50 @@
+"""Add partial unique index on pending invitations and a pending expiry index
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '021'
+down_revision: Union[str, None] = '020'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the newest of any duplicate pending invitations so the
+    # unique index can be built
+    op.execute("""
+        UPDATE invitations SET status = 'revoked'
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY tenant_id, email ORDER BY created_at DESC
+                ) AS rn
+                FROM invitations
+                WHERE status = 'pending'
+            ) ranked
+            WHERE rn > 1
+        )
+    """)
+
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_invitation_pending "
+            "ON invitations (tenant_id, email) WHERE status = 'pending'"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_invitation_expires "
+            "ON invitations (expires_at) WHERE status = 'pending'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_invitation_expires")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_invitation_pending")
@@ -0,0 +1,42 @@
+"""Drop the app-created GIN index on City.popular_areas
+
+"City" belongs to the storefront's Prisma schema, so the popular_areas column
+and any index on it are declared there. This revision stays in the chain for
+databases already stamped at 022 and removes the index an earlier version
+built. The column is left alone since Prisma may own it.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '022'
+down_revision: Union[str, None] = '021'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # "City" is created by the storefront's Prisma schema
+    if not table_exists('City'):
+        return
+
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_city_popular_areas_gin')
+
+
+def downgrade() -> None:
+    pass
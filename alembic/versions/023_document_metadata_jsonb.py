@@ -0,0 +1,33 @@
+"""Store documents.metadata as JSONB
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '023'
+down_revision: Union[str, None] = '022'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if table_exists('documents'):
+        op.execute("ALTER TABLE documents ALTER COLUMN metadata TYPE jsonb USING metadata::jsonb")
+
+
+def downgrade() -> None:
+    if table_exists('documents'):
+        op.execute("ALTER TABLE documents ALTER COLUMN metadata TYPE json USING metadata::json")
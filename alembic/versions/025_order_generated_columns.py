@@ -0,0 +1,40 @@
+"""Drop the generated amount and qr_delivered_at columns from Order
+
+"Order" belongs to the storefront's Prisma schema, so the app no longer adds
+generated columns to it. This revision stays in the chain for databases
+already stamped at 025 and removes the columns an earlier version added.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '025'
+down_revision: Union[str, None] = '024'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # "Order" is created by the storefront's Prisma schema
+    if not table_exists('Order'):
+        return
+
+    op.execute('ALTER TABLE "Order" DROP COLUMN IF EXISTS qr_delivered_at')
+    op.execute('ALTER TABLE "Order" DROP COLUMN IF EXISTS amount')
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,42 @@
+"""Drop the app-created covering index from Order
+
+"Order" belongs to the storefront's Prisma schema, so its indexes and
+maintenance are handled there. This revision stays in the chain for
+databases already stamped at 026 and removes the covering index an earlier
+version built.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '026'
+down_revision: Union[str, None] = '025'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # "Order" is created by the storefront's Prisma schema
+    if not table_exists('Order'):
+        return
+
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_order_customer_covering')
+
+
+def downgrade() -> None:
+    pass
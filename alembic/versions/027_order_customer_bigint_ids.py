@@ -0,0 +1,26 @@
+"""No-op: Order and Customer id widths are owned by Prisma
+
+An earlier version of this revision widened the "Order" and "Customer" ids
+to BIGINT. Both tables belong to the storefront's Prisma schema, so column
+types change there. The revision stays in the chain for databases already
+stamped at 027.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision: str = '027'
+down_revision: Union[str, None] = '026'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,28 @@
+"""Store call_logs provider identifiers as TEXT
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '028'
+down_revision: Union[str, None] = '027'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# VARCHAR(255) -> TEXT is a catalog-only change (no table rewrite)
+TEXT_COLUMNS = ('room_name', 'call_sid', 'egress_id')
+
+
+def upgrade() -> None:
+    for column in TEXT_COLUMNS:
+        op.execute(f"ALTER TABLE call_logs ALTER COLUMN {column} TYPE text")
+
+
+def downgrade() -> None:
+    for column in TEXT_COLUMNS:
+        op.execute(f"ALTER TABLE call_logs ALTER COLUMN {column} TYPE VARCHAR(255)")
@@ -0,0 +1,54 @@
+"""Remove the app-created slug unique constraints from Destination and City
+
+Uniqueness on these Prisma-owned tables is declared in the storefront's
+Prisma schema. An earlier version of this revision built the unique indexes
+CONCURRENTLY; on duplicate slugs that leaves an INVALID index behind and the
+revision fails on every retry. This version drops the constraint or leftover
+index, valid or not, so databases stuck at 028 can move on.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '029'
+down_revision: Union[str, None] = '028'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Prisma-owned table -> constraint/index name an earlier version created
+UNIQUE_SLUGS = {
+    'Destination': 'uq_destination_slug_locale',
+    'City': 'uq_city_slug_locale_country',
+}
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    tables = [name for name in UNIQUE_SLUGS if table_exists(name)]
+
+    # A constraint owns its index, so drop it first; no-op after a failed build
+    for table_name in tables:
+        op.execute(
+            f'ALTER TABLE "{table_name}" DROP CONSTRAINT IF EXISTS {UNIQUE_SLUGS[table_name]}'
+        )
+
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table_name in tables:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {UNIQUE_SLUGS[table_name]}')
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,70 @@
+"""Store document_chunks.embedding as halfvec(1536)
+
+halfvec arrived in pgvector 0.7; on an older extension this revision leaves
+the column as vector(1536) and does nothing.
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+# revision identifiers, used by Alembic.
+revision: str = '031'
+down_revision: Union[str, None] = '030'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HNSW_INDEX = 'ix_document_chunks_embedding_hnsw'
+HALFVEC_MIN_VERSION = (0, 7)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def pgvector_supports_halfvec() -> bool:
+    """Check if the installed pgvector extension has the halfvec type."""
+    version = op.get_bind().execute(
+        text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+    ).scalar()
+    if version is None:
+        return False
+    return tuple(int(part) for part in version.split('.')[:2]) >= HALFVEC_MIN_VERSION
+
+
+def _convert(column_type: str, opclass: str) -> None:
+    if not table_exists('document_chunks'):
+        return
+
+    # The HNSW index is opclass-specific, so rebuild it around the type change
+    op.execute(f"DROP INDEX IF EXISTS {HNSW_INDEX}")
+    op.execute(
+        f"ALTER TABLE document_chunks ALTER COLUMN embedding "
+        f"TYPE {column_type} USING embedding::{column_type}"
+    )
+
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {HNSW_INDEX} "
+            f"ON document_chunks USING hnsw (embedding {opclass}) "
+            f"WITH (m = 16, ef_construction = 64)"
+        )
+
+
+def upgrade() -> None:
+    if not pgvector_supports_halfvec():
+        return
+
+    _convert('halfvec(1536)', 'halfvec_cosine_ops')
+
+
+def downgrade() -> None:
+    _convert('vector(1536)', 'vector_cosine_ops')
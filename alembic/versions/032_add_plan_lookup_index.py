@@ -0,0 +1,41 @@
+"""Drop the app-created composite unique index from Plan
+
+"Plan" belongs to the storefront's Prisma schema, so its indexes are declared
+there. This revision stays in the chain for databases already stamped at 032
+and removes the unique index an earlier version built.
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '032'
+down_revision: Union[str, None] = '031'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # "Plan" is created by the storefront's Prisma schema
+    if not table_exists('Plan'):
+        return
+
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_plan_dest_currency_locale')
+
+
+def downgrade() -> None:
+    pass
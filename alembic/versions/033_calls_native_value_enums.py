@@ -0,0 +1,70 @@
+"""Store calls.status/direction in value-labelled native enums
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '033'
+down_revision: Union[str, None] = '032'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# column -> (new type, labels, type create_all made with member names)
+CALL_ENUMS = {
+    'status': (
+        'call_status_enum',
+        ('initiated', 'ringing', 'in_progress', 'completed', 'failed', 'no_answer', 'busy', 'transferred'),
+        'callstatus',
+    ),
+    'direction': ('call_direction_enum', ('inbound', 'outbound'), 'calldirection'),
+}
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # tenants.status and user_tenants.role were created as value-labelled
+    # enums by migrations 008/009; only the legacy calls table needs converting
+    if not table_exists('calls'):
+        return
+
+    for column, (type_name, labels, old_type) in CALL_ENUMS.items():
+        label_list = ", ".join(f"'{label}'" for label in labels)
+        op.execute(f"""
+            DO $$ BEGIN
+                CREATE TYPE {type_name} AS ENUM ({label_list});
+            EXCEPTION
+                WHEN duplicate_object THEN null;
+            END $$
+        """)
+        op.execute(f"ALTER TABLE calls ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE calls ALTER COLUMN {column} "
+            f"TYPE {type_name} USING lower({column}::text)::{type_name}"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {old_type}")
+
+
+def downgrade() -> None:
+    if not table_exists('calls'):
+        return
+
+    for column, (type_name, labels, old_type) in CALL_ENUMS.items():
+        label_list = ", ".join(f"'{label.upper()}'" for label in labels)
+        op.execute(f"CREATE TYPE {old_type} AS ENUM ({label_list})")
+        op.execute(
+            f"ALTER TABLE calls ALTER COLUMN {column} "
+            f"TYPE {old_type} USING upper({column}::text)::{old_type}"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
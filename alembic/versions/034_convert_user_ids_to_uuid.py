@@ -0,0 +1,97 @@
+"""Convert String(36) user ids and their foreign keys to native UUID
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '034'
+down_revision: Union[str, None] = '033'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose VARCHAR(36) primary key becomes a server-generated uuid
+UUID_PK_TABLES = ('users', 'tenant_settings')
+
+# (table, column, constraint, ON DELETE action) for every FK into users.id
+USER_FKS = (
+    ('tenant_settings', 'user_id', 'tenant_settings_user_id_fkey', None),
+    ('call_logs', 'user_id', 'call_logs_user_id_fkey', None),
+    ('phone_numbers', 'user_id', 'phone_numbers_user_id_fkey', None),
+    ('user_tenants', 'user_id', 'user_tenants_user_id_fkey', 'CASCADE'),
+    ('user_tenants', 'invited_by_id', 'user_tenants_invited_by_id_fkey', 'SET NULL'),
+    ('invitations', 'invited_by_id', 'invitations_invited_by_id_fkey', 'CASCADE'),
+)
+
+# Plain user id columns with no FK (documents are isolated per user, not joined)
+USER_ID_COLUMNS = (('documents', 'user_id'),)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def _add_user_fks() -> None:
+    for table_name, column, constraint, on_delete in USER_FKS:
+        if table_exists(table_name):
+            action = f" ON DELETE {on_delete}" if on_delete else ""
+            op.execute(f"""
+                ALTER TABLE {table_name}
+                ADD CONSTRAINT {constraint}
+                FOREIGN KEY ({column}) REFERENCES users(id){action}
+            """)
+
+
+def _drop_user_fks() -> None:
+    for table_name, _, constraint, _ in USER_FKS:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {constraint}")
+
+
+def upgrade() -> None:
+    # The FKs have to go while both sides change type; an in-place
+    # ALTER ... USING rewrites each table once, indexes included
+    _drop_user_fks()
+
+    for table_name in UUID_PK_TABLES:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id TYPE uuid USING id::uuid")
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+    for table_name, column, _, _ in USER_FKS:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE uuid USING {column}::uuid")
+
+    for table_name, column in USER_ID_COLUMNS:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE uuid USING {column}::uuid")
+
+    _add_user_fks()
+
+
+def downgrade() -> None:
+    _drop_user_fks()
+
+    for table_name, column in USER_ID_COLUMNS:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE VARCHAR(36) USING {column}::text")
+
+    for table_name, column, _, _ in USER_FKS:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE VARCHAR(36) USING {column}::text")
+
+    for table_name in UUID_PK_TABLES:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id DROP DEFAULT")
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN id TYPE VARCHAR(36) USING id::text")
+
+    _add_user_fks()
@@ -0,0 +1,46 @@
+"""Drop leftover per-tenant API key columns from tenant_settings
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '035'
+down_revision: Union[str, None] = '034'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Provider keys are global (environment), these were never read by the model
+API_KEY_COLUMNS = (
+    'openai_api_key',
+    'anthropic_api_key',
+    'deepgram_api_key',
+    'elevenlabs_api_key',
+    'livekit_api_secret',
+)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # Databases that predate the migrations may still carry these columns
+    if table_exists('tenant_settings'):
+        drops = ", ".join(f"DROP COLUMN IF EXISTS {column}" for column in API_KEY_COLUMNS)
+        op.execute(f"ALTER TABLE tenant_settings {drops}")
+
+
+def downgrade() -> None:
+    if table_exists('tenant_settings'):
+        adds = ", ".join(f"ADD COLUMN IF NOT EXISTS {column} TEXT" for column in API_KEY_COLUMNS)
+        op.execute(f"ALTER TABLE tenant_settings {adds}")
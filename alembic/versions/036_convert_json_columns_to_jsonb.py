@@ -0,0 +1,56 @@
+"""Convert remaining json columns to jsonb and index document chunk metadata
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '036'
+down_revision: Union[str, None] = '035'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column); documents.metadata was converted in 023
+JSON_COLUMNS = (
+    ('document_chunks', 'metadata'),
+    ('tenant_configs', 'business_hours'),
+    ('tenant_configs', 'metadata'),
+    ('calls', 'metadata'),
+    ('call_events', 'event_data'),
+)
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    for table_name, column in JSON_COLUMNS:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+    if table_exists('document_chunks'):
+        # CONCURRENTLY can't run inside a transaction block
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_metadata_gin "
+                "ON document_chunks USING gin (metadata jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_metadata_gin")
+
+    for table_name, column in JSON_COLUMNS:
+        if table_exists(table_name):
+            op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE json USING {column}::json")
@@ -0,0 +1,46 @@
+"""Add tenant/started_at indexes to calls, with a partial index for live calls
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '037'
+down_revision: Union[str, None] = '036'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not table_exists('calls'):
+        return
+
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_calls_tenant_started "
+            "ON calls (tenant_id, started_at DESC) INCLUDE (status, duration_seconds)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_calls_active "
+            "ON calls (tenant_id, started_at DESC) "
+            "WHERE status IN ('initiated', 'ringing', 'in_progress')"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_calls_active")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_calls_tenant_started")
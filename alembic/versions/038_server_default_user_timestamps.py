@@ -0,0 +1,44 @@
+"""Generate user and tenant settings timestamps server-side
+
+Revision ID: 038
+Revises: 037
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = '038'
+down_revision: Union[str, None] = '037'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Timestamp columns that now default to now() instead of a Python-side utcnow
+TIMESTAMP_DEFAULTS = {
+    'users': ('created_at', 'updated_at'),
+    'tenant_settings': ('created_at', 'updated_at'),
+}
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    for table_name, columns in TIMESTAMP_DEFAULTS.items():
+        if table_exists(table_name):
+            for column in columns:
+                op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} SET DEFAULT now()")
+
+
+def downgrade() -> None:
+    for table_name, columns in TIMESTAMP_DEFAULTS.items():
+        if table_exists(table_name):
+            for column in columns:
+                op.execute(f"ALTER TABLE {table_name} ALTER COLUMN {column} DROP DEFAULT")
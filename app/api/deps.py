@@ -8,7 +8,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.core.config import settings
 from app.core.database import get_db
@@ -79,7 +79,10 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.email == email))
+    # Per-request auth only needs the user row; skip the eager memberships load
+    result = await db.execute(
+        select(User).options(lazyload(User.tenant_memberships)).where(User.email == email)
+    )
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
@@ -96,10 +99,10 @@ async def get_current_user_context(
     Tenant can be specified via X-Tenant-ID header.
     If not specified, uses user's primary tenant.
     """
-    # Load user's tenant memberships
+    # Load user's tenant memberships (not the tenants' own users/config)
     result = await db.execute(
         select(UserTenant)
-        .options(selectinload(UserTenant.tenant))
+        .options(selectinload(UserTenant.tenant).lazyload("*"))
         .where(UserTenant.user_id == current_user.id)
     )
     memberships = result.scalars().all()
@@ -1,5 +1,6 @@
 """Admin endpoints for managing the voice agent platform."""
 
+import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -39,7 +40,7 @@ get_admin_user = get_super_admin_user
 # ============== Schemas ==============
 
 class UserListResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     email: str
     full_name: Optional[str]
     tenant_name: Optional[str]
@@ -53,7 +54,7 @@ class UserListResponse(BaseModel):
 
 
 class PhoneNumberAdmin(BaseModel):
-    id: str
+    id: uuid.UUID
     number: str
     twilio_sid: Optional[str]
     friendly_name: Optional[str]
@@ -61,7 +62,7 @@ class PhoneNumberAdmin(BaseModel):
     voice_enabled: bool
     sms_enabled: bool
     is_active: bool
-    user_id: Optional[str]
+    user_id: Optional[uuid.UUID]
     user_email: Optional[str] = None
     assigned_at: Optional[datetime]
     webhook_configured: bool
@@ -154,7 +155,7 @@ async def list_users(
 
 @router.patch("/users/{user_id}")
 async def update_user(
-    user_id: str,
+    user_id: uuid.UUID,
     is_active: Optional[bool] = None,
     is_admin: Optional[bool] = None,
     admin: User = Depends(get_admin_user),
@@ -267,7 +268,7 @@ async def add_phone_number(
 
 @router.patch("/phone-numbers/{number_id}")
 async def update_phone_number(
-    number_id: str,
+    number_id: uuid.UUID,
     request: UpdatePhoneNumberRequest,
     admin: User = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
@@ -293,7 +294,7 @@ async def update_phone_number(
 
 @router.delete("/phone-numbers/{number_id}")
 async def delete_phone_number(
-    number_id: str,
+    number_id: uuid.UUID,
     admin: User = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -322,7 +323,7 @@ async def delete_phone_number(
 
 @router.post("/phone-numbers/{number_id}/unassign")
 async def unassign_phone_number(
-    number_id: str,
+    number_id: uuid.UUID,
     admin: User = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -354,7 +355,7 @@ async def unassign_phone_number(
 
 @router.post("/phone-numbers/{number_id}/fix-webhook")
 async def fix_phone_number_webhook(
-    number_id: str,
+    number_id: uuid.UUID,
     admin: User = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -1,7 +1,6 @@
 """Authentication endpoints for Voice Agent Dashboard."""
 
 import re
-import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -14,7 +13,7 @@ from jose import JWTError, jwt
 from pydantic import BaseModel, EmailStr, field_validator
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.core.config import settings
 from app.core.database import get_db
@@ -153,7 +152,10 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.email == email))
+    # Per-request auth only needs the user row; skip the eager memberships load
+    result = await db.execute(
+        select(User).options(lazyload(User.tenant_memberships)).where(User.email == email)
+    )
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
@@ -246,7 +248,6 @@ async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     else:
         # Normal signup: create new tenant
         tenant = Tenant(
-            id=uuid.uuid4(),
             name=user_data.organization_name,
             slug=generate_slug(user_data.organization_name),
             email=user_data.email,
@@ -258,7 +259,6 @@ async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
 
         # Create default tenant config
         tenant_config = TenantConfig(
-            id=uuid.uuid4(),
             tenant_id=tenant.id,
         )
         db.add(tenant_config)
@@ -312,10 +312,10 @@ async def get_me(
     db: AsyncSession = Depends(get_db),
 ):
     """Get current user info with tenant context."""
-    # Load user's tenant memberships
+    # Load user's tenant memberships (not the tenants' own users/config)
     result = await db.execute(
         select(UserTenant)
-        .options(selectinload(UserTenant.tenant))
+        .options(selectinload(UserTenant.tenant).lazyload("*"))
         .where(UserTenant.user_id == current_user.id)
     )
     memberships = result.scalars().all()
@@ -340,7 +340,7 @@ async def get_me(
         current_tenant = tenants[0]
 
     return UserResponse(
-        id=current_user.id,
+        id=str(current_user.id),
         email=current_user.email,
         full_name=current_user.full_name,
         is_active=current_user.is_active,
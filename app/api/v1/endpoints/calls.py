@@ -1,7 +1,8 @@
 """Call management endpoints for voice agent integration."""
 
 import os
-from datetime import datetime, timezone
+import uuid
+from datetime import datetime
 from typing import List, Optional
 from urllib.parse import urlparse
 
@@ -12,6 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.api.v1.endpoints.auth import get_current_user
 from app.core.database import get_db
@@ -111,7 +113,7 @@ class CallCreateRequest(BaseModel):
     call_sid: Optional[str] = None
     caller_number: Optional[str] = None
     callee_number: Optional[str] = None
-    user_id: Optional[str] = None
+    user_id: Optional[uuid.UUID] = None
     direction: str = "inbound"
 
 
@@ -137,13 +139,13 @@ class TranscriptEntry(BaseModel):
 
 class TranscriptBatchRequest(BaseModel):
     """Batch of transcripts to save."""
-    call_id: str
+    call_id: uuid.UUID
     entries: list[TranscriptEntry]
 
 
 class CallResponse(BaseModel):
     """Call response."""
-    id: str
+    id: uuid.UUID
     room_name: str
     status: str
     caller_number: Optional[str]
@@ -160,8 +162,6 @@ async def create_call(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a call record. Called by voice agent when call starts."""
-    now = datetime.now(timezone.utc)
-
     # Create call record using simple CallLog model
     call = CallLog(
         room_name=request.room_name,
@@ -170,7 +170,6 @@ async def create_call(
         status="in_progress",
         caller_number=request.caller_number,
         callee_number=request.callee_number,
-        started_at=now,
         user_id=request.user_id,
     )
 
@@ -191,19 +190,21 @@ async def create_call(
         status="in_progress",
         caller_number=request.caller_number,
         callee_number=request.callee_number,
-        started_at=now,
+        started_at=call.started_at,
     )
 
 
 @router.post("/internal/{call_id}/update")
 async def update_call(
-    call_id: str,
+    call_id: uuid.UUID,
     request: CallUpdateRequest,
     db: AsyncSession = Depends(get_db),
 ):
     """Update call status. Called by voice agent when call ends."""
     result = await db.execute(
-        select(CallLog).where(CallLog.id == call_id)
+        select(CallLog)
+        .where(CallLog.id == call_id)
+        .options(raiseload(CallLog.transcripts))
     )
     call = result.scalar_one_or_none()
 
@@ -246,31 +247,22 @@ async def save_transcripts(
     db: AsyncSession = Depends(get_db),
 ):
     """Save transcript entries. Called by voice agent during/after call."""
-    for entry in request.entries:
-        transcript = CallTranscriptLog(
-            call_id=request.call_id,
-            speaker=entry.speaker,
-            text=entry.text,
-            confidence=entry.confidence,
-            start_time_ms=entry.start_time_ms,
-            end_time_ms=entry.end_time_ms,
-        )
-        db.add(transcript)
+    count = await CallTranscriptLog.bulk_insert(db, request.call_id, request.entries)
 
     await db.commit()
 
     logger.info(
         "transcripts_saved",
         call_id=request.call_id,
-        count=len(request.entries),
+        count=count,
     )
 
-    return {"status": "saved", "count": len(request.entries)}
+    return {"status": "saved", "count": count}
 
 
 @router.get("/internal/{call_id}/transcripts")
 async def get_call_transcripts(
-    call_id: str,
+    call_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Get all transcripts for a call."""
@@ -310,7 +302,7 @@ class TranscriptResponse(BaseModel):
 
 class CallDetailResponse(BaseModel):
     """Detailed call response with transcripts."""
-    id: str
+    id: uuid.UUID
     room_name: str
     call_sid: Optional[str]
     direction: str
@@ -331,7 +323,7 @@ class CallDetailResponse(BaseModel):
 
 class CallListResponse(BaseModel):
     """Call list item response."""
-    id: str
+    id: uuid.UUID
     direction: str
     status: str
     caller_number: Optional[str]
@@ -360,6 +352,7 @@ async def list_user_calls(
         .order_by(desc(CallLog.started_at))
         .limit(limit)
         .offset(offset)
+        .options(raiseload(CallLog.transcripts))
     )
     calls = result.scalars().all()
 
@@ -382,12 +375,12 @@ async def list_user_calls(
 
 @router.get("/{call_id}", response_model=CallDetailResponse)
 async def get_user_call(
-    call_id: str,
+    call_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific call with transcripts for the current user."""
-    # Get the call
+    # Get the call (transcripts are selectin-loaded in start_time_ms order)
     result = await db.execute(
         select(CallLog)
         .where(CallLog.id == call_id)
@@ -401,14 +394,6 @@ async def get_user_call(
             detail="Call not found",
         )
 
-    # Get transcripts
-    transcripts_result = await db.execute(
-        select(CallTranscriptLog)
-        .where(CallTranscriptLog.call_id == call_id)
-        .order_by(CallTranscriptLog.start_time_ms)
-    )
-    transcripts = transcripts_result.scalars().all()
-
     return CallDetailResponse(
         id=call.id,
         room_name=call.room_name,
@@ -431,6 +416,6 @@ async def get_user_call(
                 start_time_ms=t.start_time_ms,
                 end_time_ms=t.end_time_ms,
             )
-            for t in transcripts
+            for t in call.transcripts
         ],
     )
@@ -3,8 +3,7 @@
 from datetime import datetime, timezone
 from typing import Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -15,6 +14,7 @@ from app.schemas.checkout import (
     CheckoutResponse,
     CheckoutErrorResponse,
 )
+from app.schemas.checkout_fast import CheckoutResponseFast, encode_checkout_response
 from app.services.stripe_service import StripeService, get_plan_name
 
 router = APIRouter()
@@ -101,7 +101,7 @@ async def create_checkout(
     db: AsyncSession = Depends(get_db),
     api_key: str = Depends(verify_api_key),
     stripe_service: StripeService = Depends(get_stripe_service),
-) -> Union[CheckoutResponse, CheckoutErrorResponse]:
+) -> Union[Response, CheckoutErrorResponse]:
     """Create a Stripe checkout session and return the payment link.
 
     This endpoint is used by:
@@ -112,16 +112,14 @@ async def create_checkout(
     """
     now = datetime.now(timezone.utc)
 
-    # Look up the plan from database
-    result = await db.execute(
-        select(Plan).where(
-            Plan.destination_slug == request.destination.lower(),
-            Plan.currency == request.currency.upper(),
-        )
+    # Look up just the requested duration; Postgres picks it out of the plan's JSONB
+    destination_slug = request.destination.lower()
+    currency = request.currency.upper()
+    lookup = await Plan.fetch_duration(
+        db, destination_slug, currency, request.duration, locale=request.locale.lower()
     )
-    plan = result.scalar_one_or_none()
 
-    if not plan:
+    if lookup is None:
         return CheckoutErrorResponse(
             success=False,
             error=f"No plan found for destination: {request.destination} in {request.currency}",
@@ -129,19 +127,11 @@ async def create_checkout(
             timestamp=now,
         )
 
-    # Find the specific duration in the plan
-    durations = plan.durations if plan.durations else []
-    selected_duration = None
-    for d in durations:
-        if d.get("duration") == request.duration:
-            selected_duration = d
-            break
-
+    selected_duration = lookup.duration
     if not selected_duration:
-        available = [d.get("duration") for d in durations]
         return CheckoutErrorResponse(
             success=False,
-            error=f"Duration {request.duration} days not available. Available: {available}",
+            error=f"Duration {request.duration} days not available. Available: {lookup.available}",
             destination=request.destination,
             timestamp=now,
         )
@@ -181,7 +171,7 @@ async def create_checkout(
         f"{checkout_result['url']}"
     )
 
-    return CheckoutResponse(
+    body = CheckoutResponseFast(
         success=True,
         checkout_url=checkout_result["url"],
         session_id=checkout_result["session_id"],
@@ -194,3 +184,4 @@ async def create_checkout(
         message=message,
         timestamp=now,
     )
+    return Response(content=encode_checkout_response(body), media_type="application/json")
@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from typing import List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,20 +11,25 @@ from app.core.database import get_db
 from app.core.security import verify_api_key
 from app.models.customer import Customer
 from app.models.order import Order
+from app.schemas._adapters import ORDER_SUMMARY_LIST_ADAPTER
 from app.schemas.customer import (
-    CustomerInLookup,
     CustomerLookupRequest,
     CustomerLookupResponse,
     CustomerNotFoundResponse,
     CustomerResponse,
     DestinationInOrder,
     ESimInOrder,
-    LookupSummary,
-    OrderInLookup,
     OrderSummaryInLookup,
     PaymentInOrder,
     PlanInOrder,
 )
+from app.schemas.customer_fast import (
+    CustomerInLookupFast,
+    CustomerLookupResponseFast,
+    LookupSummaryFast,
+    OrderInLookupFast,
+    encode_lookup_response,
+)
 
 router = APIRouter()
 
@@ -108,7 +113,7 @@ async def lookup_customer(
     request: CustomerLookupRequest,
     db: AsyncSession = Depends(get_db),
     api_key: str = Depends(verify_api_key),
-) -> Union[CustomerLookupResponse, CustomerNotFoundResponse]:
+) -> Union[Response, CustomerNotFoundResponse]:
     """Look up customer by email and return their order history.
 
     This endpoint is used by Aria (AI support agent) and internal tools.
@@ -132,57 +137,66 @@ async def lookup_customer(
             timestamp=now,
         )
 
-    # Get orders (eSIM data is inline on Order, no separate table)
+    # Get orders (eSIM data is inline on Order, no separate table); only the
+    # columns the response uses, as plain rows rather than ORM entities
     orders_result = await db.execute(
-        select(Order)
+        select(
+            Order.id,
+            Order.order_number,
+            Order.destination_slug,
+            Order.destination_name,
+            Order.plan_name,
+            Order.duration,
+            Order.amount_cents,
+            Order.currency,
+            Order.status,
+            Order.esim_status,
+            Order.esim_iccid,
+            Order.esim_email_sent,
+            Order.createdAt,
+            Order.paidAt,
+        )
         .where(Order.customer_id == customer.id)
         .order_by(Order.createdAt.desc())
     )
-    orders = orders_result.scalars().all()
 
     # Build order list matching n8n format
     order_list = []
-    for order in orders:
-        # Get status as string
-        order_status = order.status.value if hasattr(order.status, "value") else str(order.status)
-
-        # Get eSIM status (inline on Order, not separate table)
-        esim_status = order.esim_status.value if hasattr(order.esim_status, "value") else str(order.esim_status)
+    completed_orders = 0
+    completed_cents = 0
+    for row in orders_result:
+        if row.status == "paid":
+            completed_orders += 1
+            completed_cents += row.amount_cents
 
         order_list.append(
-            OrderInLookup(
-                id=order.id,
-                order_number=order.order_number,
+            OrderInLookupFast(
+                id=row.id,
+                order_number=row.order_number,
                 destination=DestinationInOrder(
-                    slug=order.destination_slug,
-                    name=order.destination_name,
+                    slug=row.destination_slug,
+                    name=row.destination_name,
                 ),
                 plan=PlanInOrder(
-                    name=order.plan_name,
-                    duration_days=order.duration,  # Prisma uses "duration"
+                    name=row.plan_name,
+                    duration_days=row.duration,  # Prisma uses "duration"
                 ),
-                payment=format_payment(order.amount_cents, order.currency),
-                status=order_status,
+                payment=format_payment(row.amount_cents, row.currency),
+                status=row.status,
                 esim=ESimInOrder(
-                    status=esim_status,
-                    iccid=order.esim_iccid,
-                    email_sent=order.esim_email_sent,
+                    status=row.esim_status,
+                    iccid=row.esim_iccid,
+                    email_sent=row.esim_email_sent,
                 ),
-                created_at=order.createdAt,
-                paid_at=order.paidAt,
+                created_at=row.createdAt,
+                paid_at=row.paidAt,
             )
         )
 
-    # Calculate summary
-    completed_orders = [
-        o for o in orders
-        if (o.status.value if hasattr(o.status, "value") else str(o.status)) == "paid"
-    ]
-    total_spent = sum(o.amount_cents / 100 for o in completed_orders)
-
-    return CustomerLookupResponse(
+    # Encoded here; CustomerLookupResponse documents the same shape
+    body = CustomerLookupResponseFast(
         success=True,
-        customer=CustomerInLookup(
+        customer=CustomerInLookupFast(
             id=customer.id,
             email=customer.email,
             name=customer.name,  # Prisma uses single "name" field
@@ -191,13 +205,14 @@ async def lookup_customer(
             created_at=customer.createdAt,  # Prisma uses camelCase
         ),
         orders=order_list,
-        summary=LookupSummary(
-            total_orders=len(orders),
-            completed_orders=len(completed_orders),
-            total_spent=f"{total_spent:.2f}",
+        summary=LookupSummaryFast(
+            total_orders=len(order_list),
+            completed_orders=completed_orders,
+            total_spent=f"{completed_cents / 100:.2f}",
         ),
         timestamp=now,
     )
+    return Response(content=encode_lookup_response(body), media_type="application/json")
 
 
 @router.get("/{customer_id}", response_model=CustomerResponse)
@@ -216,7 +231,7 @@ async def get_customer(
             detail="Customer not found",
         )
 
-    return CustomerResponse.model_validate(customer)
+    return CustomerResponse.from_orm_trusted(customer)
 
 
 @router.get("/{customer_id}/orders", response_model=List[OrderSummaryInLookup])
@@ -224,7 +239,7 @@ async def get_customer_orders(
     customer_id: int,  # Prisma uses Int for id
     db: AsyncSession = Depends(get_db),
     api_key: str = Depends(verify_api_key),
-) -> List[OrderSummaryInLookup]:
+) -> Response:
     """Get all orders for a customer."""
     # Verify customer exists
     result = await db.execute(select(Customer).where(Customer.id == customer_id))
@@ -244,8 +259,10 @@ async def get_customer_orders(
     )
     orders = orders_result.scalars().all()
 
-    return [
-        OrderSummaryInLookup(
+    # Rows are trusted: construct without validation and serialize the whole
+    # list in one adapter call instead of per-element response_model checks
+    summaries = [
+        OrderSummaryInLookup.model_construct(
             id=o.id,
             order_number=o.order_number,
             status=o.status.value if hasattr(o.status, "value") else str(o.status),
@@ -258,3 +275,7 @@ async def get_customer_orders(
         )
         for o in orders
     ]
+    return Response(
+        content=ORDER_SUMMARY_LIST_ADAPTER.dump_json(summaries),
+        media_type="application/json",
+    )
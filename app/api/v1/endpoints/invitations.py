@@ -7,6 +7,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,6 +23,18 @@ from app.services.delivery_service import DeliveryService
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Partial unique index: one pending invitation per (tenant_id, email)
+PENDING_INVITATION_CONSTRAINT = "uq_invitation_pending"
+
+
+def _violated_constraint(error: IntegrityError) -> Optional[str]:
+    """Name of the constraint/index behind an IntegrityError.
+
+    SQLAlchemy's asyncpg adapter keeps the driver exception, which carries
+    Postgres' constraint_name, as the DBAPI error's __cause__.
+    """
+    return getattr(error.orig.__cause__, "constraint_name", None)
+
 
 # Pydantic schemas
 class InvitationCreate(BaseModel):
@@ -109,20 +122,6 @@ async def create_invitation(
                 detail="User is already a member of this organization",
             )
 
-    # Check for existing pending invitation
-    existing_invite = await db.execute(
-        select(Invitation).where(
-            Invitation.email == data.email,
-            Invitation.tenant_id == context.tenant_id,
-            Invitation.status == InvitationStatus.PENDING,
-        )
-    )
-    if existing_invite.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="An invitation is already pending for this email",
-        )
-
     # Create invitation
     invitation = Invitation(
         id=uuid.uuid4(),
@@ -135,7 +134,18 @@ async def create_invitation(
         status=InvitationStatus.PENDING,
     )
     db.add(invitation)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        # Only the one-pending-invitation-per-(tenant, email) index is a
+        # conflict; FK/NOT NULL violations are bugs and propagate
+        if _violated_constraint(e) != PENDING_INVITATION_CONSTRAINT:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An invitation is already pending for this email",
+        )
     await db.refresh(invitation)
 
     # Send invitation email
@@ -167,7 +177,7 @@ async def create_invitation(
         expires_at=invitation.expires_at,
         created_at=invitation.created_at,
         invited_by=InvitedByInfo(
-            id=context.user.id,
+            id=str(context.user.id),
             email=context.user.email,
             full_name=context.user.full_name,
         ),
@@ -200,7 +210,7 @@ async def list_invitations(
             expires_at=inv.expires_at,
             created_at=inv.created_at,
             invited_by=InvitedByInfo(
-                id=inv.invited_by.id if inv.invited_by else "",
+                id=str(inv.invited_by.id) if inv.invited_by else "",
                 email=inv.invited_by.email if inv.invited_by else "",
                 full_name=inv.invited_by.full_name if inv.invited_by else None,
             ),
@@ -372,7 +382,7 @@ async def list_team_members(
             role=m.role.value,
             joined_at=m.joined_at,
             invited_by=InvitedByInfo(
-                id=m.invited_by.id,
+                id=str(m.invited_by.id),
                 email=m.invited_by.email,
                 full_name=m.invited_by.full_name,
             ) if m.invited_by else None,
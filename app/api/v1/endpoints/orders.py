@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from typing import Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,7 +12,6 @@ from app.core.security import verify_api_key
 from app.models.customer import Customer
 from app.models.order import Order
 from app.schemas.order import (
-    ESimInfo,
     OrderResponse,
     ProcessRefundRequest,
     ProcessRefundResponse,
@@ -23,6 +22,7 @@ from app.schemas.order import (
     ResendQRResponse,
     ResendQRErrorResponse,
 )
+from app.schemas.order_fast import ESimInfoFast, OrderResponseFast, encode_order_response
 from app.services.order_service import OrderService
 
 router = APIRouter()
@@ -33,9 +33,9 @@ def get_order_service() -> OrderService:
     return OrderService()
 
 
-def order_to_response(order: Order) -> OrderResponse:
-    """Convert Order model to OrderResponse schema."""
-    return OrderResponse(
+def order_to_response(order: Order) -> Response:
+    """Encode an Order as an OrderResponse-shaped JSON response."""
+    body = OrderResponseFast(
         id=order.id,
         order_number=order.order_number,
         customer_id=order.customer_id,
@@ -49,7 +49,7 @@ def order_to_response(order: Order) -> OrderResponse:
         currency=order.currency,
         stripe_session_id=order.stripe_session_id,
         stripe_payment_intent_id=order.stripe_payment_intent_id,
-        esim=ESimInfo(
+        esim=ESimInfoFast(
             status=order.esim_status.value if hasattr(order.esim_status, "value") else str(order.esim_status),
             iccid=order.esim_iccid,
             smdp_address=order.esim_smdp_address,
@@ -63,6 +63,7 @@ def order_to_response(order: Order) -> OrderResponse:
         updatedAt=order.updatedAt,
         paidAt=order.paidAt,
     )
+    return Response(content=encode_order_response(body), media_type="application/json")
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -70,7 +71,7 @@ async def get_order(
     order_id: int,
     db: AsyncSession = Depends(get_db),
     api_key: str = Depends(verify_api_key),
-) -> OrderResponse:
+) -> Response:
     """Get order by ID with eSIM details."""
     result = await db.execute(select(Order).where(Order.id == order_id))
     order = result.scalar_one_or_none()
@@ -89,7 +90,7 @@ async def get_order_by_number(
     order_number: str,
     db: AsyncSession = Depends(get_db),
     api_key: str = Depends(verify_api_key),
-) -> OrderResponse:
+) -> Response:
     """Get order by order number (e.g., TRV-20240115-001)."""
     result = await db.execute(select(Order).where(Order.order_number == order_number))
     order = result.scalar_one_or_none()
@@ -166,7 +167,7 @@ async def resend_qr_code_by_id(
     esim_service = ESimService()
     delivery_service = DeliveryService()
 
-    qr_image = esim_service._generate_qr_image(order.esim_qr_code)
+    qr_image = await esim_service.generate_qr_image(order.esim_qr_code)
 
     delivery_result = await delivery_service.deliver_qr_code(
         customer_email=customer.email,
@@ -343,7 +344,7 @@ async def resend_qr_code(
     delivery_service = DeliveryService()
 
     try:
-        qr_image = esim_service._generate_qr_image(order.esim_qr_code)
+        qr_image = await esim_service.generate_qr_image(order.esim_qr_code)
     except Exception as e:
         return ResendQRErrorResponse(
             success=False,
@@ -1,5 +1,6 @@
 """Phone number management endpoints."""
 
+import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -20,7 +21,7 @@ router = APIRouter()
 
 class PhoneNumberResponse(BaseModel):
     """Phone number response."""
-    id: str
+    id: uuid.UUID
     number: str
     friendly_name: Optional[str]
     country: str
@@ -35,7 +36,7 @@ class PhoneNumberResponse(BaseModel):
 
 class MyPhoneNumberResponse(BaseModel):
     """Current user's phone number."""
-    id: str
+    id: uuid.UUID
     number: str
     friendly_name: Optional[str]
     country: str
@@ -45,7 +46,7 @@ class MyPhoneNumberResponse(BaseModel):
 
 class ClaimNumberRequest(BaseModel):
     """Request to claim a phone number."""
-    phone_number_id: str
+    phone_number_id: uuid.UUID
 
 
 @router.get("/available", response_model=list[PhoneNumberResponse])
@@ -1,5 +1,6 @@
 """Settings endpoints for Voice Agent Dashboard."""
 
+import uuid
 from typing import Optional
 
 from fastapi import APIRouter, Depends
@@ -13,6 +14,7 @@ from app.models.global_settings import GlobalSettings, SETTING_ENABLED_MODELS
 from app.models.settings import TenantSettings
 from app.models.user import User
 from app.services.models_service import get_all_available_models, merge_with_settings
+from app.services.settings_service import get_agent_settings
 
 router = APIRouter()
 
@@ -240,15 +242,12 @@ async def get_agent_settings_by_phone(
         )
 
     # Get user's settings
-    result = await db.execute(
-        select(TenantSettings).where(TenantSettings.user_id == phone.user_id)
-    )
-    settings = result.scalar_one_or_none()
+    settings = await get_agent_settings(db, phone.user_id)
 
     if not settings:
         # Return defaults for this user
         return AgentSettingsResponse(
-            user_id=phone.user_id,
+            user_id=str(phone.user_id),
             llm_provider="openai",
             llm_model="gpt-4o-mini",
             stt_provider="deepgram",
@@ -265,7 +264,7 @@ async def get_agent_settings_by_phone(
         )
 
     return AgentSettingsResponse(
-        user_id=phone.user_id,
+        user_id=str(phone.user_id),
         llm_provider=settings.llm_provider,
         llm_model=settings.llm_model,
         stt_provider=settings.stt_provider,
@@ -285,19 +284,16 @@ async def get_agent_settings_by_phone(
 # Keep the original user_id endpoint working
 @router.get("/agent/user/{user_id}", response_model=AgentSettingsResponse)
 async def get_agent_settings_by_user_id(
-    user_id: str,
+    user_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Alias for get_agent_settings."""
-    result = await db.execute(
-        select(TenantSettings).where(TenantSettings.user_id == user_id)
-    )
-    settings = result.scalar_one_or_none()
+    settings = await get_agent_settings(db, user_id)
 
     if not settings:
         # Return defaults if no settings exist
         return AgentSettingsResponse(
-            user_id=user_id,
+            user_id=str(user_id),
             llm_provider="openai",
             llm_model="gpt-4o-mini",
             stt_provider="deepgram",
@@ -314,7 +310,7 @@ async def get_agent_settings_by_user_id(
         )
 
     return AgentSettingsResponse(
-        user_id=user_id,
+        user_id=str(user_id),
         llm_provider=settings.llm_provider,
         llm_model=settings.llm_model,
         stt_provider=settings.stt_provider,
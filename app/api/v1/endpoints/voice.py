@@ -119,9 +119,9 @@ async def get_livekit_token(request: LiveKitTokenRequest):
             detail="Voice agent not configured",
         )
 
-    from app.services.livekit_service import LiveKitService
+    from app.services.livekit_service import get_livekit_service
 
-    livekit = LiveKitService()
+    livekit = get_livekit_service()
     token = livekit.create_room_token(
         room_name=request.room_name,
         participant_identity=request.participant_name,
@@ -285,19 +285,18 @@ async def twilio_incoming_call(
     room_name = f"call_{call_sid}"
 
     try:
-        from app.services.livekit_service import LiveKitService
+        from app.services.livekit_service import get_livekit_service
 
         # Create LiveKit room for the call with user context
-        livekit = LiveKitService()
+        livekit = get_livekit_service()
 
         # Include user_id in metadata so agent can fetch tenant settings
-        import json
-        room_metadata = json.dumps({
+        room_metadata = {
             "call_sid": call_sid,
             "from": from_number,
             "to": to_number,
             "user_id": user_id,  # For tenant-specific settings
-        })
+        }
 
         await livekit.create_room(
             room_name=room_name,
@@ -1,12 +1,14 @@
 """Webhook endpoints for external service integrations."""
 
+import msgspec
 from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.logging import get_logger
-from app.schemas.webhook import DeliveryStatusWebhook, WebhookResponse
+from app.schemas.webhook import WebhookResponse
+from app.schemas.webhook_fast import ESIMProviderWebhook
 from app.services.background_tasks import schedule_connection_guarantee_check
 from app.services.order_service import OrderService
 from app.services.stripe_service import StripeService
@@ -61,10 +63,10 @@ async def stripe_webhook(
             detail="Invalid signature",
         )
 
-    event_type = event.get("type")
-    event_data = event.get("data", {})
+    event_type = event.type
+    event_data = event.data
 
-    logger.info("stripe_webhook_received", event_type=event_type, event_id=event.get("id"))
+    logger.info("stripe_webhook_received", event_type=event_type, event_id=event.id)
 
     # Handle different event types
     if event_type == "payment_intent.succeeded":
@@ -164,10 +166,16 @@ async def esim_provider_webhook(
     db: AsyncSession = Depends(get_db),
 ) -> WebhookResponse:
     """Handle eSIM provider webhooks (activation status, etc.)."""
-    body = await request.json()
+    try:
+        event = msgspec.json.decode(await request.body(), type=ESIMProviderWebhook)
+    except (msgspec.DecodeError, msgspec.ValidationError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
 
-    event_type = body.get("event_type")
-    esim_id = body.get("esim_id") or body.get("iccid")
+    event_type = event.event_type
+    esim_id = event.esim_id or event.iccid
 
     logger.info(
         "esim_provider_event",
@@ -0,0 +1,136 @@
+"""Static CORS handling for a fixed origin allowlist.
+
+Replaces Starlette's CORSMiddleware: every header it would compute for an
+allowed origin is built once at startup, so a request costs one dict lookup.
+"""
+
+from typing import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Allowed CORS origins
+CORS_ORIGINS = [
+    "https://voice-agent-dashboard-jade.vercel.app",
+    "https://voice-agent-dashboard.vercel.app",
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://localhost:3002",
+    "http://localhost:3003",
+    "http://localhost:3004",
+    "http://localhost:3005",
+]
+
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = b"600"
+
+# Headers we set ourselves - stripped from inner responses to avoid duplicates
+_CORS_HEADER_NAMES = frozenset({
+    b"access-control-allow-origin",
+    b"access-control-allow-credentials",
+    b"access-control-allow-methods",
+    b"access-control-allow-headers",
+    b"access-control-expose-headers",
+})
+
+
+def _simple_headers(origin: bytes) -> list[tuple[bytes, bytes]]:
+    return [
+        (b"access-control-allow-origin", origin),
+        (b"access-control-allow-credentials", b"true"),
+        (b"access-control-expose-headers", b"*"),
+    ]
+
+
+def _preflight_headers(origin: bytes) -> list[tuple[bytes, bytes]]:
+    return [
+        (b"access-control-allow-origin", origin),
+        (b"access-control-allow-credentials", b"true"),
+        (b"access-control-allow-methods", ALLOW_METHODS),
+        (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+        (b"vary", b"Origin"),
+        (b"content-type", b"text/plain; charset=utf-8"),
+    ]
+
+
+class StaticCORSMiddleware:
+    """ASGI middleware answering CORS from precomputed per-origin header tables.
+
+    Mirrors CORSMiddleware(allow_credentials=True, allow_methods=["*"],
+    allow_headers=["*"], expose_headers=["*"]) for the given origins.
+    """
+
+    def __init__(self, app: ASGIApp, origins: Iterable[str]) -> None:
+        self.app = app
+        raw_origins = [origin.encode("latin-1") for origin in origins]
+        self._simple = {origin: _simple_headers(origin) for origin in raw_origins}
+        self._preflight = {origin: _preflight_headers(origin) for origin in raw_origins}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight_response(origin, request_headers, send)
+            return
+
+        cors_headers = self._simple.get(origin)
+        if cors_headers is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = []
+                vary = None
+                for name, value in message.get("headers", ()):
+                    if name == b"vary":
+                        vary = value
+                    elif name not in _CORS_HEADER_NAMES:
+                        headers.append((name, value))
+                headers.extend(cors_headers)
+                headers.append((b"vary", vary + b", Origin" if vary else b"Origin"))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight_response(
+        self,
+        origin: bytes,
+        request_headers: bytes | None,
+        send: Send,
+    ) -> None:
+        """Answer an OPTIONS preflight without touching the application."""
+        headers = self._preflight.get(origin)
+        if headers is None:
+            status, body = 400, b"Disallowed CORS origin"
+            headers = [(b"vary", b"Origin"), (b"content-type", b"text/plain; charset=utf-8")]
+        else:
+            status, body = 200, b"OK"
+            if request_headers:
+                # allow_headers=["*"] with credentials: echo the requested headers
+                headers = [*headers, (b"access-control-allow-headers", request_headers)]
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [*headers, (b"content-length", str(len(body)).encode("latin-1"))],
+        })
+        await send({"type": "http.response.body", "body": body})
+
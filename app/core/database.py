@@ -48,6 +48,9 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    # Compiled-statement LRU (default 500); sized so the steady-state set of
+    # ORM statements across all models stays cached per engine
+    query_cache_size=1200,
 )
 
 async_session_maker = async_sessionmaker(
@@ -78,7 +81,9 @@ async def init_db() -> None:
     import sys
     from sqlalchemy import text
 
-    # Run Alembic migrations (migrations are idempotent - safe to run multiple times)
+    # Run Alembic migrations (migrations are idempotent - safe to run multiple times).
+    # The models assume the schema at head (e.g. UUID user ids from 034), so a
+    # failed upgrade must stop startup rather than fall through to create_all.
     try:
         result = subprocess.run(
             [sys.executable, "-m", "alembic", "upgrade", "head"],
@@ -86,13 +91,13 @@ async def init_db() -> None:
             text=True,
             timeout=60
         )
-        if result.returncode == 0:
-            print(f"Alembic migrations completed successfully")
-        else:
-            # Log but don't fail - migrations might partially succeed
-            print(f"Alembic migration info: {result.stderr[:500] if result.stderr else 'OK'}")
-    except Exception as e:
-        print(f"Could not run Alembic migrations: {e}")
+    except subprocess.TimeoutExpired as e:
+        raise RuntimeError("Alembic migrations timed out before reaching head") from e
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Alembic migrations failed: {result.stderr[-500:] if result.stderr else 'no output'}"
+        )
+    print("Alembic migrations completed successfully")
 
     async with engine.begin() as conn:
         # Create tables if they don't exist (fallback)
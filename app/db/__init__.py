@@ -1,5 +1,15 @@
 """Database module."""
 
-from app.db.base import Base, TenantMixin, TimestampMixin
+from app.db.base import Base, TenantMixin, TimestampMixin, timestamp, updated_timestamp, uuid_pk
+from app.db.types import StringEnum, native_enum
 
-__all__ = ["Base", "TenantMixin", "TimestampMixin"]
+__all__ = [
+    "Base",
+    "StringEnum",
+    "TenantMixin",
+    "TimestampMixin",
+    "native_enum",
+    "timestamp",
+    "updated_timestamp",
+    "uuid_pk",
+]
@@ -2,38 +2,49 @@
 
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy import DateTime, ForeignKey, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
 
 
+# Shared column declarations: annotate with Mapped[timestamp] etc. instead of
+# repeating the mapped_column() arguments in every model
+
+# UUID primary key generated by Postgres (pgcrypto), fetched back via RETURNING
+uuid_pk = Annotated[
+    uuid.UUID,
+    mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")),
+]
+
+# Insert time, set by the database
+timestamp = Annotated[
+    datetime,
+    mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False),
+]
+
+# Insert time, refreshed to now() by every ORM UPDATE
+updated_timestamp = Annotated[
+    datetime,
+    mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    ),
+]
+
+
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base class with common fields."""
 
     # All models get a UUID primary key
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4,
-    )
+    id: Mapped[uuid_pk]
 
 
 class TimestampMixin:
     """Mixin that adds created_at and updated_at timestamps."""
 
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        nullable=False,
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[updated_timestamp]
 
 
 class TenantMixin:
@@ -0,0 +1,45 @@
+"""Custom SQLAlchemy column types."""
+
+import enum
+from typing import Any, Optional
+
+from sqlalchemy import Enum, String
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class StringEnum(TypeDecorator):
+    """Python enum stored by value in a plain VARCHAR column.
+
+    Avoids native Postgres ENUM types: adding a value is a CHECK constraint
+    change instead of ALTER TYPE. Pair with a CheckConstraint on the table.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum], length: int = 20) -> None:
+        super().__init__(length)
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[str]:
+        if value is None:
+            return None
+        # Accepts members or raw values; unknown values raise ValueError
+        return self.enum_class(value).value
+
+    def process_result_value(self, value: Optional[str], dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        return self.enum_class(value)
+
+
+def native_enum(enum_class: type[enum.Enum], name: str, **kwargs: Any) -> Enum:
+    """Native Postgres ENUM type storing member values ('admin'), not names ('ADMIN')."""
+    return Enum(
+        enum_class,
+        name=name,
+        native_enum=True,
+        values_callable=lambda members: [member.value for member in members],
+        **kwargs,
+    )
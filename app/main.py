@@ -5,26 +5,18 @@ This is the main entry point for the Voice Agent API.
 
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.cors import CORS_ORIGINS, StaticCORSMiddleware
 from app.core.database import init_db
 from app.core.logging import logger, setup_logging
-
-# Allowed CORS origins
-CORS_ORIGINS = [
-    "https://voice-agent-dashboard-jade.vercel.app",
-    "https://voice-agent-dashboard.vercel.app",
-    "http://localhost:3000",
-    "http://localhost:3001",
-    "http://localhost:3002",
-    "http://localhost:3003",
-    "http://localhost:3004",
-    "http://localhost:3005",
-]
+from app.services.delivery_service import close_resend_client
+from app.services.esim_service import close_esimgo_client
 
 
 def get_cors_headers(request: Request) -> dict:
@@ -55,6 +47,13 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Voice Agent API")
+    await close_resend_client()
+    await close_esimgo_client()
+
+    # Imported here, like the voice endpoints do, so startup doesn't load the SDK
+    from app.services.livekit_service import close_livekit_service
+
+    await close_livekit_service()
 
 
 # Create FastAPI application
@@ -86,18 +85,15 @@ API endpoints require authentication via Bearer token or API key.
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     openapi_url="/openapi.json" if settings.debug else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["*"],
-)
+# CORS middleware (static per-origin header table, preflights answered directly)
+app.add_middleware(StaticCORSMiddleware, origins=CORS_ORIGINS)
+
+# Compress larger JSON payloads (call lists, transcripts); tiny bodies are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
 # HTTP exception handler (4xx errors)
@@ -105,7 +101,7 @@ app.add_middleware(
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions with CORS headers."""
     cors_headers = get_cors_headers(request)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
         headers=cors_headers,
@@ -129,13 +125,13 @@ async def global_exception_handler(request: Request, exc: Exception):
 
     # Don't expose internal errors in production
     if settings.is_production:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": "Internal server error"},
             headers=cors_headers,
         )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": str(exc)},
         headers=cors_headers,
@@ -146,24 +142,29 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
 
+# Static response bodies - settings are fixed at import, so encode once
+_ROOT_BYTES = orjson.dumps({
+    "name": settings.app_name,
+    "version": "1.0.2",
+    "status": "operational",
+    "docs": f"{settings.api_v1_prefix}/docs" if settings.debug else None,
+    "admin_enabled": True,
+})
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+
+
 # Root endpoint
 @app.get("/")
 async def root():
     """Root endpoint - basic API info."""
-    return {
-        "name": settings.app_name,
-        "version": "1.0.2",
-        "status": "operational",
-        "docs": f"{settings.api_v1_prefix}/docs" if settings.debug else None,
-        "admin_enabled": True,
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # Simple health check for Railway (no DB required)
 @app.get("/health")
 async def health():
     """Simple health check for load balancer."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
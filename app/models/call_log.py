@@ -2,29 +2,33 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterable, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, Float
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, Float, desc, insert
+from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.db.base import Base, timestamp
 
 
 class CallLog(Base):
     """Simple call log for recording calls and transcripts."""
 
     __tablename__ = "call_logs"
-
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # "Recent calls for a user": backward index scan satisfies ORDER BY + LIMIT
+        # (leading user_id also serves plain user_id lookups)
+        Index("ix_call_logs_user_started", "user_id", desc("started_at")),
+        Index("ix_call_logs_user_status_started", "user_id", "status", desc("started_at")),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
-    # Call identification
-    room_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    call_sid: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    user_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=True, index=True
+    # Call identification (opaque provider ids: TEXT, no length check)
+    room_name: Mapped[str] = mapped_column(Text, nullable=False, index=True)
+    call_sid: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )
 
     # Call details
@@ -34,9 +38,7 @@ class CallLog(Base):
     callee_number: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Timing
-    started_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
-    )
+    started_at: Mapped[timestamp]
     ended_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -47,19 +49,20 @@ class CallLog(Base):
     agent_response_count: Mapped[int] = mapped_column(Integer, default=0)
 
     # Recording
-    egress_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    egress_id: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     recording_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
-    )
+    created_at: Mapped[timestamp]
 
-    # Relationship to transcripts
+    # Relationship to transcripts - loaded with one "WHERE call_id IN (...)"
+    # query; list views that don't need them should use raiseload()
     transcripts: Mapped[list["CallTranscriptLog"]] = relationship(
         "CallTranscriptLog",
         back_populates="call",
         cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="CallTranscriptLog.start_time_ms",
     )
 
 
@@ -67,16 +70,15 @@ class CallTranscriptLog(Base):
     """Call transcript entries."""
 
     __tablename__ = "call_transcript_logs"
-
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # Matches "WHERE call_id = ? ORDER BY start_time_ms": one ordered range scan
+        Index("ix_transcript_call_time", "call_id", "start_time_ms"),
     )
 
-    call_id: Mapped[str] = mapped_column(
-        String(36),
+    call_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey("call_logs.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Speaker
@@ -91,9 +93,42 @@ class CallTranscriptLog(Base):
     end_time_ms: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
-    )
+    created_at: Mapped[timestamp]
 
     # Relationship
     call: Mapped["CallLog"] = relationship("CallLog", back_populates="transcripts")
+
+    # Rows per executemany INSERT when bulk-saving transcripts
+    BULK_INSERT_BATCH_SIZE = 1000
+
+    @classmethod
+    async def bulk_insert(
+        cls,
+        session: AsyncSession,
+        call_id: uuid.UUID,
+        segments: Iterable[Any],
+    ) -> int:
+        """Insert transcript segments with Core executemany, bypassing the unit of work.
+
+        Each segment needs speaker, text, confidence, start_time_ms and end_time_ms
+        attributes. id and created_at come from server defaults, so only the
+        segment columns are bound per row.
+        Returns the number of rows inserted.
+        """
+        rows = [
+            {
+                "call_id": call_id,
+                "speaker": segment.speaker,
+                "text": segment.text,
+                "confidence": segment.confidence,
+                "start_time_ms": segment.start_time_ms,
+                "end_time_ms": segment.end_time_ms,
+            }
+            for segment in segments
+        ]
+
+        statement = insert(cls.__table__)
+        for start in range(0, len(rows), cls.BULK_INSERT_BATCH_SIZE):
+            await session.execute(statement, rows[start:start + cls.BULK_INSERT_BATCH_SIZE])
+
+        return len(rows)
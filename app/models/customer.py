@@ -28,6 +28,7 @@ class Customer(Base):
     """
 
     __tablename__ = "Customer"  # Prisma uses PascalCase table names
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
@@ -41,24 +42,31 @@ class Customer(Base):
     createdAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updatedAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
-    # Relationships
-    orders: Mapped[List["Order"]] = relationship("Order", back_populates="customer")
+    # Relationships - never lazy-loaded; use selectinload(Customer.orders) explicitly
+    orders: Mapped[List["Order"]] = relationship(
+        "Order", back_populates="customer", lazy="raise"
+    )
+
+    def _name_parts(self) -> tuple[Optional[str], Optional[str]]:
+        """Split name into (first, last) on the first space.
+
+        Computed on each access: name can change under the instance through
+        refresh/expire, so a cached split would go stale.
+        """
+        if not self.name:
+            return None, None
+        first, sep, last = self.name.partition(" ")
+        return first, last if sep else None
 
     @property
     def first_name(self) -> Optional[str]:
         """Extract first name from name field for backwards compatibility."""
-        if self.name:
-            parts = self.name.split(" ", 1)
-            return parts[0] if parts else None
-        return None
+        return self._name_parts()[0]
 
     @property
     def last_name(self) -> Optional[str]:
         """Extract last name from name field for backwards compatibility."""
-        if self.name:
-            parts = self.name.split(" ", 1)
-            return parts[1] if len(parts) > 1 else None
-        return None
+        return self._name_parts()[1]
 
     def __repr__(self) -> str:
         return f"<Customer {self.email}>"
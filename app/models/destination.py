@@ -13,6 +13,7 @@ class Destination(Base):
     """Destination model - matches existing Prisma Destination table."""
 
     __tablename__ = "Destination"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     slug: Mapped[str] = mapped_column(String(50), index=True, nullable=False)
@@ -39,6 +40,7 @@ class City(Base):
     """City model - matches existing Prisma City table."""
 
     __tablename__ = "City"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     slug: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -13,6 +13,7 @@ class DeviceBrand(Base):
     """Device brand model - matches existing Prisma DeviceBrand table."""
 
     __tablename__ = "DeviceBrand"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
@@ -39,6 +40,7 @@ class Device(Base):
     """Device model - matches existing Prisma Device table."""
 
     __tablename__ = "Device"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     brand_id: Mapped[int] = mapped_column(
@@ -2,14 +2,14 @@
 
 import enum
 import uuid
-from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import CheckConstraint, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.db.base import Base, timestamp, updated_timestamp
+from app.db.types import StringEnum
 
 
 class DocumentStatus(str, enum.Enum):
@@ -35,6 +35,17 @@ class Document(Base):
     """Document for RAG knowledge base (user-scoped)."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'processing', 'completed', 'failed')",
+            name="ck_document_status",
+        ),
+        CheckConstraint(
+            "doc_type IN ('pdf', 'txt', 'docx', 'url', 'manual')",
+            name="ck_document_doc_type",
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -43,13 +54,13 @@ class Document(Base):
     )
 
     # User ownership (for multi-tenant isolation via Pinecone namespaces)
-    user_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
 
     # Document info
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     doc_type: Mapped[DocumentType] = mapped_column(
-        Enum(DocumentType), default=DocumentType.MANUAL, nullable=False
+        StringEnum(DocumentType), default=DocumentType.MANUAL, nullable=False
     )
 
     # Content (stored for reference, embeddings in Pinecone)
@@ -57,7 +68,7 @@ class Document(Base):
 
     # Processing
     status: Mapped[DocumentStatus] = mapped_column(
-        Enum(DocumentStatus),
+        StringEnum(DocumentStatus),
         default=DocumentStatus.PENDING,
         nullable=False,
     )
@@ -65,20 +76,11 @@ class Document(Base):
     chunk_count: Mapped[int] = mapped_column(Integer, default=0)
 
     # Metadata
-    extra_data: Mapped[Optional[dict]] = mapped_column("metadata", JSON)
+    extra_data: Mapped[Optional[dict]] = mapped_column("metadata", JSONB)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        nullable=False,
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[updated_timestamp]
 
     def __repr__(self) -> str:
         return f"<Document {self.name} ({self.status})>"
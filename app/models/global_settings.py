@@ -1,13 +1,12 @@
 """Global settings model for platform-wide configuration."""
 
-from datetime import datetime
 from typing import Optional
-import uuid
 
-from sqlalchemy import DateTime, String, Text, JSON
+from sqlalchemy import String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.db.base import Base, timestamp, updated_timestamp
 
 
 class GlobalSettings(Base):
@@ -18,19 +17,12 @@ class GlobalSettings(Base):
 
     __tablename__ = "global_settings"
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
-    )
     key: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
-    value: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    value: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[updated_timestamp]
 
     def __repr__(self) -> str:
         return f"<GlobalSettings key={self.key}>"
@@ -6,11 +6,13 @@ import uuid
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String, and_, func, text
+from sqlalchemy.dialects.postgresql import CITEXT, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, timestamp, updated_timestamp
+from app.db.types import StringEnum
 from app.models.user_tenant import UserRole
 
 if TYPE_CHECKING:
@@ -46,6 +48,34 @@ class Invitation(Base):
     """
 
     __tablename__ = "invitations"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'accepted', 'expired', 'revoked')",
+            name="ck_invitation_status",
+        ),
+        CheckConstraint(
+            "role IN ('super_admin', 'admin', 'user')",
+            name="ck_invitation_role",
+        ),
+        # Serves the is_valid filter: status equality, then expires_at range
+        Index("ix_invitation_status_expires", "status", "expires_at"),
+        # At most one pending invitation per (tenant, email); accepted,
+        # expired and revoked rows don't conflict
+        Index(
+            "uq_invitation_pending",
+            "tenant_id",
+            "email",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Lets the expiry sweep find stale pending invitations
+        Index(
+            "ix_invitation_expires",
+            "expires_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -61,16 +91,16 @@ class Invitation(Base):
         index=True,
     )
 
-    # Email of the person being invited
+    # Email of the person being invited (CITEXT: compared case-insensitively)
     email: Mapped[str] = mapped_column(
-        String(255),
+        CITEXT(),
         nullable=False,
         index=True,
     )
 
     # Role they will have when they join
     role: Mapped[UserRole] = mapped_column(
-        Enum(UserRole, name="user_role_enum", create_type=False),
+        StringEnum(UserRole),
         default=UserRole.USER,
         nullable=False,
     )
@@ -85,8 +115,8 @@ class Invitation(Base):
     )
 
     # Who sent the invitation
-    invited_by_id: Mapped[str] = mapped_column(
-        String(36),
+    invited_by_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -100,7 +130,7 @@ class Invitation(Base):
 
     # Status tracking
     status: Mapped[InvitationStatus] = mapped_column(
-        Enum(InvitationStatus, name="invitation_status_enum"),
+        StringEnum(InvitationStatus),
         default=InvitationStatus.PENDING,
         nullable=False,
     )
@@ -112,28 +142,25 @@ class Invitation(Base):
     )
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        nullable=False,
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[updated_timestamp]
 
     # Relationships
     tenant: Mapped["Tenant"] = relationship("Tenant")
     invited_by: Mapped["User"] = relationship("User")
 
-    @property
+    @hybrid_property
     def is_valid(self) -> bool:
         """Check if invitation is still valid (pending and not expired)."""
         if self.status != InvitationStatus.PENDING:
             return False
         return datetime.utcnow() < self.expires_at.replace(tzinfo=None)
 
+    @is_valid.inplace.expression
+    @classmethod
+    def _is_valid_expression(cls):
+        """SQL form of is_valid, so select(Invitation).where(Invitation.is_valid) filters in the database."""
+        return and_(cls.status == InvitationStatus.PENDING, cls.expires_at > func.now())
+
     def __repr__(self) -> str:
         return f"<Invitation {self.email} to tenant={self.tenant_id} status={self.status.value}>"
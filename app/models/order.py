@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -70,6 +70,7 @@ class Order(Base):
     """
 
     __tablename__ = "Order"  # Prisma uses PascalCase table names
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     order_number: Mapped[str] = mapped_column(String(20), unique=True, index=True)
@@ -121,14 +122,19 @@ class Order(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps (Prisma uses camelCase)
-    createdAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    createdAt: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updatedAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     paidAt: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
 
-    # Relationships
-    customer: Mapped["Customer"] = relationship("Customer", back_populates="orders")
+    # Relationships - never lazy-loaded; use joinedload(Order.customer) or
+    # db.get(Customer, order.customer_id) explicitly
+    customer: Mapped["Customer"] = relationship(
+        "Customer", back_populates="orders", lazy="raise"
+    )
 
     # Compatibility properties for existing code
     @property
@@ -1,13 +1,14 @@
 """Phone number model for multi-tenant telephony."""
 
+import uuid
 from datetime import datetime
 from typing import Optional
-import uuid
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.db.base import Base, timestamp, updated_timestamp
 
 
 class PhoneNumber(Base):
@@ -17,10 +18,15 @@ class PhoneNumber(Base):
     """
 
     __tablename__ = "phone_numbers"
-
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # The unclaimed pool only, in the order the "available numbers" list reads it
+        Index(
+            "ix_phone_available",
+            "number",
+            postgresql_where=text("user_id IS NULL AND is_active = true"),
+        ),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     # The actual phone number (E.164 format)
     number: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
@@ -39,8 +45,8 @@ class PhoneNumber(Base):
     sms_enabled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Assignment
-    user_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=True, index=True
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True
     )
     assigned_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
@@ -49,12 +55,8 @@ class PhoneNumber(Base):
     webhook_configured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[updated_timestamp]
 
     @property
     def is_available(self) -> bool:
@@ -1,15 +1,33 @@
 """Plan database model - matches Prisma schema."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import DateTime, Float, Integer, String
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Float, Integer, String, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, JSONPATH
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column, reconstructor, validates
 
 from app.core.database import Base
 
 
+# First element of durations whose "duration" equals the $d variable
+_DURATION_PATH = "$[*] ? (@.duration == $d)"
+# Every offered day count, for "not available" messages
+_DURATION_DAYS_PATH = "$[*].duration"
+
+
+@dataclass(frozen=True, slots=True)
+class DurationLookup:
+    """Result of Plan.fetch_duration for a plan that exists."""
+
+    # The matching durations entry, or None when the plan doesn't offer it
+    duration: Optional[dict]
+    # Day counts the plan does offer
+    available: list[int]
+
+
 class Plan(Base):
     """Plan model - matches Prisma Plan table.
 
@@ -44,14 +62,67 @@ class Plan(Base):
     createdAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updatedAt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+    @staticmethod
+    def _index_durations(durations: Optional[list]) -> dict[int, dict]:
+        return {plan["duration"]: plan for plan in durations or () if "duration" in plan}
+
+    @reconstructor
+    def _init_on_load(self) -> None:
+        """Build the duration -> plan index once per loaded row."""
+        self._durations_by_day = self._index_durations(self.durations)
+
+    @validates("durations")
+    def _reindex_durations(self, key: str, value: Optional[list]) -> Optional[list]:
+        """Keep the duration index in step when durations is assigned."""
+        self._durations_by_day = self._index_durations(value)
+        return value
+
     def get_duration_plan(self, duration_days: int) -> Optional[dict]:
         """Get plan details for a specific duration."""
-        if not self.durations:
+        return getattr(self, "_durations_by_day", {}).get(duration_days)
+
+    @classmethod
+    async def fetch_duration(
+        cls,
+        session: AsyncSession,
+        destination_slug: str,
+        currency: str,
+        duration_days: int,
+        locale: Optional[str] = None,
+    ) -> Optional[DurationLookup]:
+        """Fetch one duration entry, selected by Postgres from the JSONB list.
+
+        Only the matching object and the list of offered day counts cross the
+        wire instead of the whole durations blob. Among the destination's
+        locales, a plan offering the duration wins, then the requested locale,
+        then the lowest locale/id, so the pick is deterministic.
+        Returns None when no plan exists for the destination and currency.
+        """
+        duration = func.jsonb_path_query_first(
+            cls.durations,
+            cast(_DURATION_PATH, JSONPATH),
+            literal({"d": duration_days}, JSONB),
+            type_=JSONB,
+        )
+        available = func.jsonb_path_query_array(
+            cls.durations, cast(_DURATION_DAYS_PATH, JSONPATH), type_=JSONB
+        )
+        preference = [duration.is_(None)]
+        if locale is not None:
+            preference.append(cls.locale != locale)
+        statement = (
+            select(duration, available)
+            .where(
+                cls.destination_slug == destination_slug,
+                cls.currency == currency,
+            )
+            .order_by(*preference, cls.locale, cls.id)
+            .limit(1)
+        )
+        row = (await session.execute(statement)).one_or_none()
+        if row is None:
             return None
-        for plan in self.durations:
-            if plan.get("duration") == duration_days:
-                return plan
-        return None
+        return DurationLookup(duration=row[0], available=row[1] or [])
 
     def get_all_durations(self) -> List[dict]:
         """Get all duration plans."""
@@ -4,12 +4,13 @@ import enum
 import uuid
 from typing import TYPE_CHECKING
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Enum, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TenantMixin, TimestampMixin
+from app.db.types import StringEnum
 
 if TYPE_CHECKING:
     from app.models.tenant import Tenant
@@ -38,11 +39,21 @@ class Document(Base, TimestampMixin, TenantMixin):
     """Document for RAG knowledge base."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'processing', 'completed', 'failed')",
+            name="ck_document_status",
+        ),
+        CheckConstraint(
+            "doc_type IN ('pdf', 'txt', 'docx', 'url', 'manual')",
+            name="ck_document_doc_type",
+        ),
+    )
 
     # Document info
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    description: Mapped[str | None] = mapped_column(Text)
-    doc_type: Mapped[DocumentType] = mapped_column(Enum(DocumentType), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, deferred=True)
+    doc_type: Mapped[DocumentType] = mapped_column(StringEnum(DocumentType), nullable=False)
 
     # Source
     source_url: Mapped[str | None] = mapped_column(String(1000))
@@ -51,7 +62,7 @@ class Document(Base, TimestampMixin, TenantMixin):
 
     # Processing
     status: Mapped[DocumentStatus] = mapped_column(
-        Enum(DocumentStatus),
+        StringEnum(DocumentStatus),
         default=DocumentStatus.PENDING,
         nullable=False,
     )
@@ -59,7 +70,7 @@ class Document(Base, TimestampMixin, TenantMixin):
     chunk_count: Mapped[int] = mapped_column(Integer, default=0)
 
     # Metadata
-    extra_data: Mapped[dict | None] = mapped_column("metadata", JSON)
+    extra_data: Mapped[dict | None] = mapped_column("metadata", JSONB)
 
     # Relationships
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="documents")
@@ -74,6 +85,24 @@ class DocumentChunk(Base, TimestampMixin):
     """Document chunk with embedding for vector search."""
 
     __tablename__ = "document_chunks"
+    __table_args__ = (
+        # ANN index for cosine distance; queries must ORDER BY embedding <=> :q
+        # (cosine_distance) LIMIT k for the planner to use it
+        Index(
+            "ix_document_chunks_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        # Containment filters on chunk metadata (metadata @> '{...}')
+        Index(
+            "ix_document_chunks_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
 
     document_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -83,14 +112,17 @@ class DocumentChunk(Base, TimestampMixin):
     )
 
     # Content
-    content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Deferred so listing chunks doesn't detoast the text; entity loads can
+    # undefer_group("content")
+    content: Mapped[str] = mapped_column(Text, nullable=False, deferred=True, deferred_group="content")
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    # Embedding (1536 dimensions for OpenAI text-embedding-3-small)
-    embedding: Mapped[list[float] | None] = mapped_column(Vector(1536))
+    # Embedding (1536 dimensions for OpenAI text-embedding-3-small), stored as
+    # FP16 - half the bytes per distance computation, ample precision for cosine
+    embedding: Mapped[list[float] | None] = mapped_column(HALFVEC(1536))
 
     # Metadata
-    extra_data: Mapped[dict | None] = mapped_column("metadata", JSON)
+    extra_data: Mapped[dict | None] = mapped_column("metadata", JSONB)
     token_count: Mapped[int | None] = mapped_column(Integer)
 
     # Relationships
@@ -1,13 +1,13 @@
 """Tenant settings model for storing user configuration."""
 
-from datetime import datetime
 from typing import Optional
 import uuid
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Float, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from app.db.base import Base, timestamp, updated_timestamp
 
 
 class TenantSettings(Base):
@@ -19,12 +19,10 @@ class TenantSettings(Base):
     """
 
     __tablename__ = "tenant_settings"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
-    )
-    user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), unique=True, nullable=False
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False
     )
 
     # LLM Configuration (provider choice only - keys are global)
@@ -62,12 +60,8 @@ class TenantSettings(Base):
     rag_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     call_recording_enabled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[updated_timestamp]
 
     def __repr__(self) -> str:
         return f"<TenantSettings user_id={self.user_id}>"
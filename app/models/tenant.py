@@ -5,11 +5,12 @@ import uuid
 from datetime import time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, Boolean, Enum, ForeignKey, String, Text, Time
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, ForeignKey, String, Text, Time
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
+from app.db.types import native_enum
 
 if TYPE_CHECKING:
     from app.models.call import Call
@@ -35,7 +36,7 @@ class Tenant(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
     status: Mapped[TenantStatus] = mapped_column(
-        Enum(TenantStatus),
+        native_enum(TenantStatus, "tenant_status_enum"),
         default=TenantStatus.TRIAL,
         nullable=False,
     )
@@ -53,16 +54,20 @@ class Tenant(Base, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Relationships
+    # users/config load with one IN query per batch of tenants rather than one
+    # query per tenant; calls/documents are large, load those per query site
     users: Mapped[list["UserTenant"]] = relationship(
         "UserTenant",
         back_populates="tenant",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
     config: Mapped["TenantConfig | None"] = relationship(
         "TenantConfig",
         back_populates="tenant",
         uselist=False,
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
     calls: Mapped[list["Call"]] = relationship(
         "Call",
@@ -90,7 +95,7 @@ class TenantConfig(Base, TimestampMixin):
 
     # Business hours (stored as JSON for flexibility)
     business_hours: Mapped[dict | None] = mapped_column(
-        JSON,
+        JSONB,
         default=lambda: {
             "monday": {"open": "09:00", "close": "17:00"},
             "tuesday": {"open": "09:00", "close": "17:00"},
@@ -104,7 +109,9 @@ class TenantConfig(Base, TimestampMixin):
     timezone: Mapped[str] = mapped_column(String(50), default="America/New_York")
 
     # AI Agent configuration
-    system_prompt: Mapped[str | None] = mapped_column(Text)
+    # Deferred: config rides along with every tenant load (selectin), the prompt
+    # is only needed when a call starts
+    system_prompt: Mapped[str | None] = mapped_column(Text, deferred=True)
     greeting_message: Mapped[str] = mapped_column(
         Text,
         default="Hello! Thank you for calling. How can I help you today?",
@@ -129,7 +136,7 @@ class TenantConfig(Base, TimestampMixin):
     rag_similarity_threshold: Mapped[float] = mapped_column(default=0.7)
 
     # Custom metadata
-    extra_data: Mapped[dict | None] = mapped_column("metadata", JSON)
+    extra_data: Mapped[dict | None] = mapped_column("metadata", JSONB)
 
     # Relationships
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="config")
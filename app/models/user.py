@@ -1,13 +1,11 @@
 """User database model for authentication."""
 
-from datetime import datetime
 from typing import TYPE_CHECKING, Optional
-import uuid
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.db.base import Base, timestamp, updated_timestamp
 
 if TYPE_CHECKING:
     from app.models.user_tenant import UserTenant
@@ -17,10 +15,8 @@ class User(Base):
     """User model for voice agent authentication."""
 
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
-    )
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     full_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     hashed_password: Mapped[str] = mapped_column(Text, nullable=False)
@@ -29,12 +25,8 @@ class User(Base):
     # Deprecated: use tenant_memberships relationship instead
     tenant_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
-    )
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[updated_timestamp]
 
     # Relationships
     tenant_memberships: Mapped[list["UserTenant"]] = relationship(
@@ -42,6 +34,7 @@ class User(Base):
         back_populates="user",
         foreign_keys="UserTenant.user_id",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
     def __repr__(self) -> str:
@@ -2,14 +2,14 @@
 
 import enum
 import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import Boolean, ForeignKey, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, timestamp, updated_timestamp
+from app.db.types import native_enum
 
 if TYPE_CHECKING:
     from app.models.tenant import Tenant
@@ -42,9 +42,9 @@ class UserTenant(Base):
         default=uuid.uuid4,
     )
 
-    # FK to users table (String(36) UUID format)
-    user_id: Mapped[str] = mapped_column(
-        String(36),
+    # FK to users table (UUID)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -60,7 +60,7 @@ class UserTenant(Base):
 
     # Role within this tenant
     role: Mapped[UserRole] = mapped_column(
-        Enum(UserRole, name="user_role_enum"),
+        native_enum(UserRole, "user_role_enum"),
         default=UserRole.USER,
         nullable=False,
     )
@@ -73,29 +73,16 @@ class UserTenant(Base):
     )
 
     # Invitation tracking
-    invited_by_id: Mapped[str | None] = mapped_column(
-        String(36),
+    invited_by_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
     )
 
     # Timestamps
-    joined_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        nullable=False,
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        nullable=False,
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
+    joined_at: Mapped[timestamp]
+    created_at: Mapped[timestamp]
+    updated_at: Mapped[updated_timestamp]
 
     # Relationships
     user: Mapped["User"] = relationship(
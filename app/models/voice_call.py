@@ -5,11 +5,12 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, desc, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TenantMixin, TimestampMixin
+from app.db.types import native_enum
 
 if TYPE_CHECKING:
     from app.models.tenant import Tenant
@@ -39,6 +40,23 @@ class Call(Base, TimestampMixin, TenantMixin):
     """Call/session record."""
 
     __tablename__ = "calls"
+    __table_args__ = (
+        # Tenant call history, newest first; status/duration ride along so the
+        # dashboard list is an index-only scan
+        Index(
+            "ix_calls_tenant_started",
+            "tenant_id",
+            desc("started_at"),
+            postgresql_include=["status", "duration_seconds"],
+        ),
+        # Live calls only - a small fraction of rows at any time
+        Index(
+            "ix_calls_active",
+            "tenant_id",
+            desc("started_at"),
+            postgresql_where=text("status IN ('initiated', 'ringing', 'in_progress')"),
+        ),
+    )
 
     # Call identification
     external_id: Mapped[str | None] = mapped_column(String(255), index=True)
@@ -46,9 +64,11 @@ class Call(Base, TimestampMixin, TenantMixin):
     twilio_sid: Mapped[str | None] = mapped_column(String(255))
 
     # Call details
-    direction: Mapped[CallDirection] = mapped_column(Enum(CallDirection), nullable=False)
+    direction: Mapped[CallDirection] = mapped_column(
+        native_enum(CallDirection, "call_direction_enum"), nullable=False
+    )
     status: Mapped[CallStatus] = mapped_column(
-        Enum(CallStatus),
+        native_enum(CallStatus, "call_status_enum"),
         default=CallStatus.INITIATED,
         nullable=False,
     )
@@ -73,7 +93,7 @@ class Call(Base, TimestampMixin, TenantMixin):
     total_tokens_used: Mapped[int] = mapped_column(Integer, default=0)
 
     # Metadata
-    extra_data: Mapped[dict | None] = mapped_column("metadata", JSON)
+    extra_data: Mapped[dict | None] = mapped_column("metadata", JSONB, deferred=True)
 
     # Relationships
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="calls")
@@ -102,7 +122,7 @@ class CallEvent(Base, TimestampMixin):
     )
 
     event_type: Mapped[str] = mapped_column(String(100), nullable=False)
-    event_data: Mapped[dict | None] = mapped_column(JSON)
+    event_data: Mapped[dict | None] = mapped_column(JSONB)
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -128,7 +148,7 @@ class CallTranscript(Base, TimestampMixin):
     speaker: Mapped[str] = mapped_column(String(50), nullable=False)  # "caller", "agent"
 
     # Content
-    text: Mapped[str] = mapped_column(Text, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
     confidence: Mapped[float | None] = mapped_column()
 
     # Timing
@@ -0,0 +1,7 @@
+"""TypeAdapters for list responses, built once at import."""
+
+from pydantic import TypeAdapter
+
+from app.schemas.customer import OrderSummaryInLookup
+
+ORDER_SUMMARY_LIST_ADAPTER = TypeAdapter(list[OrderSummaryInLookup])
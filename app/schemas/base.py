@@ -0,0 +1,53 @@
+"""Shared schema bases and field types."""
+
+import re
+from typing import Annotated, Any, ClassVar
+
+from pydantic import AfterValidator, BaseModel, StringConstraints, WithJsonSchema
+
+_EMAIL_RE = re.compile(r"^[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}$", re.IGNORECASE)
+
+
+def _check_email(value: str) -> str:
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+# Syntax-only email check for the public API schemas; EmailStr's
+# email-validator normalization costs microseconds per request
+Email = Annotated[
+    str,
+    AfterValidator(_check_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
+# Bounded request strings, sized to their Order/Plan columns so oversized
+# input is rejected by pydantic-core before reaching a query
+OrderNumber = Annotated[str, StringConstraints(max_length=20)]
+DestinationSlug = Annotated[str, StringConstraints(max_length=50)]
+CurrencyCode = Annotated[str, StringConstraints(min_length=3, max_length=3)]
+Locale = Annotated[str, StringConstraints(max_length=10)]
+
+
+class TrustedORMModel(BaseModel):
+    """Response schema that can be filled from an ORM row without validation.
+
+    Database rows were validated on the way in, so from_orm_trusted copies
+    attributes straight into model_construct. Untrusted input (webhook
+    payloads, request bodies) must keep going through model_validate.
+    """
+
+    # Field names, captured once per subclass
+    _orm_fields: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._orm_fields = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """Build an instance from obj's attributes, skipping validation."""
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls._orm_fields})
@@ -3,7 +3,9 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
+
+from app.schemas.base import CurrencyCode, DestinationSlug, Email, Locale
 
 
 class CheckoutRequest(BaseModel):
@@ -12,12 +14,12 @@ class CheckoutRequest(BaseModel):
     Used by Aria (chat) and phone support to generate payment links.
     """
 
-    destination: str = Field(..., description="Destination slug (e.g., 'japan')")
+    destination: DestinationSlug = Field(..., description="Destination slug (e.g., 'japan')")
     duration: int = Field(..., description="Duration in days (e.g., 7)")
-    currency: str = Field("AUD", description="Currency code (AUD, USD, SGD, etc.)")
-    locale: str = Field("en-au", description="Locale for checkout page")
+    currency: CurrencyCode = Field("AUD", description="Currency code (AUD, USD, SGD, etc.)")
+    locale: Locale = Field("en-au", description="Locale for checkout page")
     promo_code: Optional[str] = Field(None, description="Promo code to apply")
-    customer_email: Optional[EmailStr] = Field(None, description="Customer email to prefill")
+    customer_email: Optional[Email] = Field(None, description="Customer email to prefill")
     customer_phone: Optional[str] = Field(None, description="Customer phone for SMS delivery")
 
 
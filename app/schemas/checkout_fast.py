@@ -0,0 +1,33 @@
+"""msgspec mirror of CheckoutResponse, encoded straight to bytes.
+
+CheckoutResponse in app.schemas.checkout remains the documented shape; field
+names here must match it.
+"""
+
+from datetime import datetime
+
+import msgspec
+
+
+class CheckoutResponseFast(msgspec.Struct, frozen=True):
+    """Checkout response body."""
+
+    success: bool
+    checkout_url: str
+    session_id: str
+    destination: str
+    destination_name: str
+    duration: int
+    plan_name: str
+    price: float
+    currency: str
+    message: str
+    timestamp: datetime
+
+
+_encoder = msgspec.json.Encoder()
+
+
+def encode_checkout_response(response: CheckoutResponseFast) -> bytes:
+    """Encode a checkout response to JSON bytes."""
+    return _encoder.encode(response)
@@ -1,15 +1,18 @@
 """Customer schemas - matches Prisma schema."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import Email, TrustedORMModel
 
 
 class CustomerBase(BaseModel):
     """Base customer schema - matches Prisma Customer model."""
 
-    email: EmailStr
+    email: Email
     name: Optional[str] = None
     phone: Optional[str] = None
 
@@ -20,7 +23,7 @@ class CustomerCreate(CustomerBase):
     pass
 
 
-class CustomerResponse(CustomerBase):
+class CustomerResponse(CustomerBase, TrustedORMModel):
     """Customer response schema - matches Prisma Customer model."""
 
     id: int  # Prisma uses Int for id
@@ -28,8 +31,7 @@ class CustomerResponse(CustomerBase):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # ============================================================================
@@ -40,7 +42,7 @@ class CustomerResponse(CustomerBase):
 class CustomerLookupRequest(BaseModel):
     """Request schema for customer lookup."""
 
-    email: EmailStr = Field(..., description="Customer email address")
+    email: Email = Field(..., description="Customer email address")
 
 
 class CustomerInLookup(BaseModel):
@@ -54,21 +56,28 @@ class CustomerInLookup(BaseModel):
     created_at: datetime
 
 
-class DestinationInOrder(BaseModel):
-    """Destination details in order."""
+@dataclass(slots=True, frozen=True)
+class DestinationInOrder:
+    """Destination details in order.
+
+    The *InOrder parts are plain slotted dataclasses: built once per order
+    row, they skip model validation and Pydantic passes instances through.
+    """
 
     slug: str
     name: str
 
 
-class PlanInOrder(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PlanInOrder:
     """Plan details in order."""
 
     name: str
     duration_days: int
 
 
-class PaymentInOrder(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PaymentInOrder:
     """Payment details in order."""
 
     cents: int
@@ -76,7 +85,8 @@ class PaymentInOrder(BaseModel):
     formatted: str
 
 
-class ESimInOrder(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ESimInOrder:
     """eSIM details in order."""
 
     status: Optional[str] = None
@@ -143,5 +153,4 @@ class OrderSummaryInLookup(BaseModel):
     currency: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
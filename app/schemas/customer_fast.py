@@ -0,0 +1,66 @@
+"""msgspec mirror of the customer lookup response, encoded straight to bytes.
+
+The lookup serializes one nested order entry per order row. Building these
+Structs from selected columns and encoding them with msgspec skips Pydantic
+validation and FastAPI's response serialization. CustomerLookupResponse in
+app.schemas.customer remains the documented shape; field names and nesting
+here must match it.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import msgspec
+
+from app.schemas.customer import DestinationInOrder, ESimInOrder, PaymentInOrder, PlanInOrder
+
+
+class CustomerInLookupFast(msgspec.Struct, frozen=True):
+    """Customer info in lookup response."""
+
+    id: int
+    email: str
+    name: Optional[str]
+    phone: Optional[str]
+    stripe_customer_id: Optional[str]
+    created_at: datetime
+
+
+class OrderInLookupFast(msgspec.Struct, frozen=True):
+    """Order details in lookup response."""
+
+    id: int
+    order_number: str
+    destination: DestinationInOrder
+    plan: PlanInOrder
+    payment: PaymentInOrder
+    status: str
+    esim: ESimInOrder
+    created_at: datetime
+    paid_at: Optional[datetime]
+
+
+class LookupSummaryFast(msgspec.Struct, frozen=True):
+    """Summary stats in lookup response."""
+
+    total_orders: int
+    completed_orders: int
+    total_spent: str
+
+
+class CustomerLookupResponseFast(msgspec.Struct, frozen=True):
+    """Customer lookup response body."""
+
+    success: bool
+    customer: CustomerInLookupFast
+    orders: list[OrderInLookupFast]
+    summary: LookupSummaryFast
+    timestamp: datetime
+
+
+_encoder = msgspec.json.Encoder()
+
+
+def encode_lookup_response(response: CustomerLookupResponseFast) -> bytes:
+    """Encode a lookup response to JSON bytes."""
+    return _encoder.encode(response)
@@ -1,15 +1,18 @@
 """Order schemas - matches Prisma schema."""
 
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+from app.schemas.base import DestinationSlug, OrderNumber
 
 
 class OrderBase(BaseModel):
     """Base order schema."""
 
-    destination_slug: str
+    destination_slug: DestinationSlug
     bundle_name: Optional[str] = None  # eSIM-Go bundle identifier
     customer_email: str
 
@@ -55,8 +58,7 @@ class OrderResponse(BaseModel):
     updatedAt: datetime
     paidAt: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class OrderSummary(BaseModel):
@@ -70,8 +72,7 @@ class OrderSummary(BaseModel):
     currency: str
     createdAt: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class OrderProcessingResult(BaseModel):
@@ -84,7 +85,7 @@ class OrderProcessingResult(BaseModel):
     qr_delivered: bool = False
     delivery_channel: Optional[str] = None
     processing_time_ms: int = 0
-    errors: list[str] = []
+    errors: tuple[str, ...] = ()  # Immutable default: nothing copied per instance
 
 
 class RefundRequest(BaseModel):
@@ -114,7 +115,7 @@ class ResendQRRequest(BaseModel):
     """
 
     order_id: Optional[int] = Field(None, description="Order ID (if known)")
-    order_number: Optional[str] = Field(None, description="Order number (e.g., TRV-20240115-001)")
+    order_number: Optional[OrderNumber] = Field(None, description="Order number (e.g., TRV-20240115-001)")
     customer_email: Optional[str] = Field(None, description="Customer email for verification")
     channel: str = Field(
         "email",
@@ -168,7 +169,7 @@ class ProcessRefundRequest(BaseModel):
     """
 
     order_id: Optional[int] = Field(None, description="Order ID (if known)")
-    order_number: Optional[str] = Field(
+    order_number: Optional[OrderNumber] = Field(
         None, description="Order number (e.g., TRV-20240115-001)"
     )
     customer_email: Optional[str] = Field(
@@ -184,14 +185,52 @@ class ProcessRefundRequest(BaseModel):
     )
 
 
+RefundStep = Literal[
+    "eligibility_check", "bundle_revoke", "bundle_refund", "stripe_refund", "email_notification"
+]
+
+
+@dataclass(slots=True, frozen=True)
+class RefundStepDetails:
+    """Step-specific refund details; each step sets only its own fields."""
+
+    # eligibility_check
+    data_used_mb: Optional[float] = None
+    eligible: Optional[bool] = None
+    force_override: Optional[bool] = None
+    # bundle_revoke
+    iccid: Optional[str] = None
+    bundle: Optional[str] = None
+    # bundle_refund
+    usage_id: Optional[str] = None
+    # stripe_refund
+    refund_id: Optional[str] = None
+    amount: Optional[float] = None
+    already_refunded: Optional[bool] = None
+
+
+_REFUND_DETAIL_FIELDS = tuple(f.name for f in fields(RefundStepDetails))
+
+
 class RefundStepResult(BaseModel):
     """Result of a single refund step."""
 
-    step: str = Field(..., description="Step name: eligibility_check, bundle_revoke, bundle_refund, stripe_refund, email_notification")
+    step: RefundStep = Field(..., description="Step name: eligibility_check, bundle_revoke, bundle_refund, stripe_refund, email_notification")
     success: bool
     message: Optional[str] = None
     error: Optional[str] = None
-    details: Optional[dict] = None
+    details: Optional[RefundStepDetails] = None
+
+    @field_serializer("details")
+    def _serialize_details(self, details: Optional[RefundStepDetails]) -> Optional[dict[str, Any]]:
+        """Emit only the fields the step set, as the response always has."""
+        if details is None:
+            return None
+        return {
+            name: value
+            for name in _REFUND_DETAIL_FIELDS
+            if (value := getattr(details, name)) is not None
+        }
 
 
 class ProcessRefundResponse(BaseModel):
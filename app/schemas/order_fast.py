@@ -0,0 +1,53 @@
+"""msgspec mirror of OrderResponse, encoded straight to bytes.
+
+OrderResponse in app.schemas.order remains the documented shape; field names
+and nesting here must match it.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import msgspec
+
+
+class ESimInfoFast(msgspec.Struct, frozen=True):
+    """eSIM information within an order (inline fields)."""
+
+    status: str
+    iccid: Optional[str]
+    smdp_address: Optional[str]
+    matching_id: Optional[str]
+    qr_code: Optional[str]
+    order_ref: Optional[str]
+    provisioned_at: Optional[datetime]
+
+
+class OrderResponseFast(msgspec.Struct, frozen=True):
+    """Order response body."""
+
+    id: int
+    order_number: str
+    customer_id: int
+    status: str
+    destination_slug: str
+    destination_name: str
+    plan_name: str
+    bundle_name: Optional[str]
+    duration: int  # Days
+    amount_cents: int
+    currency: str
+    stripe_session_id: Optional[str]
+    stripe_payment_intent_id: Optional[str]
+    esim: ESimInfoFast
+    locale: str
+    createdAt: datetime
+    updatedAt: datetime
+    paidAt: Optional[datetime]
+
+
+_encoder = msgspec.json.Encoder()
+
+
+def encode_order_response(response: OrderResponseFast) -> bytes:
+    """Encode an order response to JSON bytes."""
+    return _encoder.encode(response)
@@ -1,19 +1,23 @@
 """Plan schemas - matches Prisma Plan table structure."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.base import CurrencyCode, DestinationSlug, Locale
 
-class DurationPlan(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class DurationPlan:
     """Single duration option within a plan."""
 
-    duration: int = Field(..., description="Duration in days")
-    daily_rate: float = Field(..., description="Price per day")
-    bundle_name: str = Field(..., description="eSIM Go bundle identifier")
-    retail_price: float = Field(..., description="Total retail price")
-    wholesale_cents: Optional[int] = Field(None, description="Wholesale cost in cents")
+    duration: Annotated[int, Field(description="Duration in days")]
+    daily_rate: Annotated[float, Field(description="Price per day")]
+    bundle_name: Annotated[str, Field(description="eSIM Go bundle identifier")]
+    retail_price: Annotated[float, Field(description="Total retail price")]
+    wholesale_cents: Annotated[Optional[int], Field(description="Wholesale cost in cents")] = None
 
 
 class PlanResponse(BaseModel):
@@ -27,19 +31,18 @@ class PlanResponse(BaseModel):
     default_durations: Optional[List[int]] = None
     durations: List[DurationPlan]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class PlanLookupRequest(BaseModel):
     """Request schema for plan lookup."""
 
-    destination: Optional[str] = Field(
+    destination: Optional[DestinationSlug] = Field(
         None,
         description="Destination slug (e.g., 'japan')",
     )
-    currency: str = Field("AUD", description="Currency for pricing (AUD, USD, SGD, etc.)")
-    locale: str = Field("en-au", description="Locale (e.g., 'en-au', 'en-us')")
+    currency: CurrencyCode = Field("AUD", description="Currency for pricing (AUD, USD, SGD, etc.)")
+    locale: Locale = Field("en-au", description="Locale (e.g., 'en-au', 'en-us')")
     duration: Optional[int] = Field(None, description="Filter by specific duration in days")
 
 
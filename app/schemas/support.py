@@ -3,7 +3,9 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+
+from app.schemas.base import Email
 
 
 class SupportTriageRequest(BaseModel):
@@ -11,7 +13,7 @@ class SupportTriageRequest(BaseModel):
 
     subject: str
     message: str
-    customer_email: Optional[EmailStr] = None
+    customer_email: Optional[Email] = None
     order_id: Optional[int] = None  # Prisma uses Int for order id
     channel: str = "email"
 
@@ -0,0 +1,30 @@
+"""msgspec mirrors of the webhook schemas, decoded straight from request bytes.
+
+Webhook bodies are parsed on every delivery and carry no custom validation,
+so these skip Pydantic. The Pydantic models in app.schemas.webhook remain the
+documented shapes.
+"""
+
+from typing import Any, Optional
+
+import msgspec
+
+
+class StripeWebhookEvent(msgspec.Struct, frozen=True):
+    """Stripe webhook event."""
+
+    id: str
+    type: str
+    data: dict[str, Any]
+    created: int
+    livemode: bool
+
+
+class ESIMProviderWebhook(msgspec.Struct, frozen=True):
+    """Generic eSIM provider webhook."""
+
+    event_type: str
+    esim_id: Optional[str] = None
+    iccid: Optional[str] = None
+    status: Optional[str] = None
+    data: dict[str, Any] = {}
@@ -5,15 +5,86 @@ Uses in-memory scheduling with asyncio for delayed tasks.
 """
 
 import asyncio
-from datetime import datetime, timedelta, timezone
-from typing import Callable
+import heapq
+import itertools
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from app.services.delivery_service import DeliveryService
+    from app.services.esim_service import ESimService
+    from app.services.notification_service import NotificationService
+
 logger = get_logger(__name__)
 
-# In-memory storage for scheduled tasks
-_scheduled_tasks: dict[str, asyncio.Task] = {}
+# Pending delayed calls as a heap of (fire_at, seq, task_id, func, args, kwargs),
+# fire_at on the event loop clock. One dispatcher task sleeps until the
+# earliest entry instead of one sleeping task per scheduled call.
+_pending: list[tuple[float, int, str, Callable, tuple, dict[str, Any]]] = []
+
+# task_id -> seq of its live heap entry; entries whose seq no longer matches
+# were cancelled or replaced and are dropped when they surface
+_scheduled: dict[str, int] = {}
+
+# Dead heap entries still holding their func/args; compacted away once they
+# are the majority so cancelled calls don't stay referenced until fire time
+_stale = 0
+STALE_COMPACT_MIN = 64
+
+_seq = itertools.count()
+_wake = asyncio.Event()
+_dispatcher_task: Optional[asyncio.Task] = None
+
+# Fired calls, held until they finish so they aren't garbage collected
+_running: set[asyncio.Task] = set()
+
+
+async def _run_scheduled(task_id: str, func: Callable, args: tuple, kwargs: dict[str, Any]) -> None:
+    try:
+        await func(*args, **kwargs)
+    except Exception as e:
+        logger.error("scheduled_task_failed", task_id=task_id, error=str(e))
+
+
+def _mark_stale() -> None:
+    """Count a newly dead heap entry; rebuild the heap once they dominate it."""
+    global _stale
+
+    _stale += 1
+    if _stale >= STALE_COMPACT_MIN and _stale * 2 > len(_pending):
+        _pending[:] = [entry for entry in _pending if _scheduled.get(entry[2]) == entry[1]]
+        heapq.heapify(_pending)
+        _stale = 0
+
+
+async def _dispatch_scheduled() -> None:
+    """Start each pending call when due; exits once the heap is empty."""
+    global _stale
+
+    loop = asyncio.get_running_loop()
+    while _pending:
+        fire_at = _pending[0][0]
+        if fire_at > loop.time():
+            # Woken early when a sooner entry is pushed
+            _wake.clear()
+            timer = loop.call_at(fire_at, _wake.set)
+            try:
+                await _wake.wait()
+            finally:
+                timer.cancel()
+            continue
+
+        _, seq, task_id, func, args, kwargs = heapq.heappop(_pending)
+        if _scheduled.get(task_id) != seq:
+            _stale -= 1
+            continue
+        del _scheduled[task_id]
+
+        task = asyncio.create_task(_run_scheduled(task_id, func, args, kwargs))
+        _running.add(task)
+        task.add_done_callback(_running.discard)
 
 
 async def schedule_delayed_task(
@@ -31,38 +102,79 @@ async def schedule_delayed_task(
         func: Async function to run
         *args, **kwargs: Arguments to pass to the function
     """
-    async def _run_after_delay():
-        try:
-            await asyncio.sleep(delay_seconds)
-            await func(*args, **kwargs)
-        except asyncio.CancelledError:
-            logger.info("scheduled_task_cancelled", task_id=task_id)
-        except Exception as e:
-            logger.error("scheduled_task_failed", task_id=task_id, error=str(e))
-        finally:
-            _scheduled_tasks.pop(task_id, None)
-
-    # Cancel existing task with same ID if exists
-    if task_id in _scheduled_tasks:
-        _scheduled_tasks[task_id].cancel()
-
-    task = asyncio.create_task(_run_after_delay())
-    _scheduled_tasks[task_id] = task
+    global _dispatcher_task
+
+    seq = next(_seq)
+    fire_at = asyncio.get_running_loop().time() + delay_seconds
+
+    # Replaces any pending task with the same ID
+    replaced = task_id in _scheduled
+    _scheduled[task_id] = seq
+    if replaced:
+        logger.info("scheduled_task_cancelled", task_id=task_id)
+        _mark_stale()
+
+    heapq.heappush(_pending, (fire_at, seq, task_id, func, args, kwargs))
+
+    if _dispatcher_task is None or _dispatcher_task.done():
+        _dispatcher_task = asyncio.create_task(_dispatch_scheduled())
+    elif _pending[0][1] == seq:
+        _wake.set()
 
     logger.info(
         "task_scheduled",
         task_id=task_id,
-        run_at=datetime.now(timezone.utc) + timedelta(seconds=delay_seconds),
+        # Epoch seconds: a float add instead of building an aware datetime
+        run_at=time.time() + delay_seconds,
     )
 
 
 def cancel_scheduled_task(task_id: str) -> bool:
-    """Cancel a scheduled task by ID."""
-    task = _scheduled_tasks.pop(task_id, None)
-    if task:
-        task.cancel()
-        return True
-    return False
+    """Cancel a scheduled task by ID (before it starts running)."""
+    if _scheduled.pop(task_id, None) is None:
+        return False
+    _mark_stale()
+    logger.info("scheduled_task_cancelled", task_id=task_id)
+    return True
+
+
+# Service singletons shared by every scheduled check and retry
+_esim_service: "ESimService | None" = None
+_delivery_service: "DeliveryService | None" = None
+_notification_service: "NotificationService | None" = None
+
+
+def get_esim_service() -> "ESimService":
+    """Get or create the shared ESimService."""
+    global _esim_service
+
+    if _esim_service is None:
+        from app.services.esim_service import ESimService
+
+        _esim_service = ESimService()
+    return _esim_service
+
+
+def get_delivery_service() -> "DeliveryService":
+    """Get or create the shared DeliveryService."""
+    global _delivery_service
+
+    if _delivery_service is None:
+        from app.services.delivery_service import DeliveryService
+
+        _delivery_service = DeliveryService()
+    return _delivery_service
+
+
+def get_notification_service() -> "NotificationService":
+    """Get or create the shared NotificationService."""
+    global _notification_service
+
+    if _notification_service is None:
+        from app.services.notification_service import NotificationService
+
+        _notification_service = NotificationService()
+    return _notification_service
 
 
 async def schedule_connection_guarantee_check(
@@ -77,7 +189,6 @@ async def schedule_connection_guarantee_check(
     """
     from app.core.database import async_session_maker
     from app.models.order import Order, EsimStatus
-    from app.services.notification_service import NotificationService
 
     async def check_guarantee():
         async with async_session_maker() as db:
@@ -105,7 +216,7 @@ async def schedule_connection_guarantee_check(
 
             # If not activated, notify support team
             if order.esim_status != EsimStatus.activated:
-                notifications = NotificationService()
+                notifications = get_notification_service()
                 await notifications._send_message(
                     notifications.alerts_chat_id,
                     f"<b>Guarantee Check Alert</b>\n\n"
@@ -125,33 +236,31 @@ async def schedule_connection_guarantee_check(
 async def resend_failed_delivery(order_id: int, delay_minutes: int = 5) -> None:
     """Schedule a retry for failed QR code delivery."""
     from sqlalchemy import select
+    from sqlalchemy.orm import joinedload
 
     from app.core.database import async_session_maker
-    from app.models.customer import Customer
     from app.models.order import Order
-    from app.services.delivery_service import DeliveryService
-    from app.services.esim_service import ESimService
 
     async def retry_delivery():
         async with async_session_maker() as db:
-            result = await db.execute(select(Order).where(Order.id == order_id))
+            # Order and customer in one round trip
+            result = await db.execute(
+                select(Order).options(joinedload(Order.customer)).where(Order.id == order_id)
+            )
             order = result.scalar_one_or_none()
 
             if not order or not order.esim_qr_code:
                 logger.error("delivery_retry_order_not_found", order_id=order_id)
                 return
 
-            customer = await db.get(Customer, order.customer_id)
+            customer = order.customer
             if not customer:
                 logger.error("delivery_retry_customer_not_found", order_id=order_id)
                 return
 
-            esim_service = ESimService()
-            delivery_service = DeliveryService()
-
-            qr_image = esim_service._generate_qr_image(order.esim_qr_code)
+            qr_image = await get_esim_service().generate_qr_image(order.esim_qr_code)
 
-            delivery_result = await delivery_service.deliver_qr_code(
+            delivery_result = await get_delivery_service().deliver_qr_code(
                 customer_email=customer.email,
                 customer_phone=customer.phone,
                 customer_name=customer.name,
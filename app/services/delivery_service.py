@@ -1,17 +1,187 @@
 """Multi-channel delivery service for QR codes (email, SMS)."""
 
-import base64
+import asyncio
+import binascii
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Optional
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
-from twilio.rest import Client as TwilioClient
+import orjson
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+from twilio.base.exceptions import TwilioException, TwilioRestException
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+RESEND_API_URL = "https://api.resend.com"
+
+# Shared Resend client (singleton): one keep-alive pool for every
+# DeliveryService instance, so sends reuse a warm TLS connection
+_resend_client: httpx.AsyncClient | None = None
+
+
+def get_resend_client() -> httpx.AsyncClient:
+    """Get or create the shared Resend HTTP client."""
+    global _resend_client
+
+    if _resend_client is None:
+        _resend_client = httpx.AsyncClient(
+            base_url=RESEND_API_URL,
+            headers={
+                "Authorization": f"Bearer {settings.resend_api_key}",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            http2=True,
+        )
+    return _resend_client
+
+
+def _is_transient_resend_error(exc: BaseException) -> bool:
+    """Retry network failures, rate limits and 5xx; a 4xx won't succeed on retry."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _is_transient_twilio_error(exc: BaseException) -> bool:
+    """Retry connection failures, rate limits and 5xx; not a 4xx (bad number, ...)."""
+    if isinstance(exc, TwilioRestException):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, OSError)
+
+
+# Failures a delivery channel reports instead of raising. Anything else is a
+# bug and propagates. OSError covers the requests errors the Twilio SDK leaks;
+# ValueError covers an undecodable Resend reply.
+_EMAIL_ERRORS = (httpx.HTTPError, ValueError)
+_SMS_ERRORS = (TwilioException, OSError)
+
+
+# Jittered backoff so concurrent sends don't retry in lockstep after an outage
+_retry_resend = retry(
+    reraise=True,
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.5, max=5),
+    retry=retry_if_exception(_is_transient_resend_error),
+)
+_retry_twilio = retry(
+    reraise=True,
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.5, max=5),
+    retry=retry_if_exception(_is_transient_twilio_error),
+)
+
+# Dedicated pool for the blocking Twilio SDK, so an SMS burst can't starve
+# the loop's default executor; threads are only started on first use
+TWILIO_MAX_WORKERS = 8
+_twilio_executor = ThreadPoolExecutor(max_workers=TWILIO_MAX_WORKERS, thread_name_prefix="twilio")
+
+# Strong refs to fire-and-forget sends so they aren't collected mid-flight
+_notification_tasks: set[asyncio.Task] = set()
+
+
+async def close_resend_client() -> None:
+    """Close the shared Resend HTTP client."""
+    global _resend_client
+
+    if _resend_client is not None:
+        await _resend_client.aclose()
+        _resend_client = None
+
+
+# Twilio message statuses that mean the send was accepted
+_SMS_OK_STATUSES = frozenset({"queued", "sent"})
+
+# SMS has character limits, so send a link to the QR viewer
+_QR_SMS_TEMPLATE = (
+    "Trvel: Your {destination} eSIM is ready!\n\n"
+    "View & scan your QR code:\n"
+    "{url}\n\n"
+    "10-min connection guarantee."
+)
+
+EMAIL_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+
+def _load_email_template(filename: str) -> str:
+    """Read an email template once at import, minus per-line indentation.
+
+    Indentation is insignificant between HTML tags and inside text, so
+    dropping it shrinks every Resend request body without changing the
+    rendered email. Templates are str.format_map strings.
+    """
+    text = (EMAIL_TEMPLATE_DIR / filename).read_text(encoding="utf-8")
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+# QR delivery email - matches trvel-website styling
+_QR_EMAIL_TEMPLATE = _load_email_template("qr_delivery.html")
+
+# Refund confirmation email - Trvel branding
+_REFUND_EMAIL_TEMPLATE = _load_email_template("refund.html")
+
+# Team invitation email - VoxxCalls branding
+_INVITATION_EMAIL_TEMPLATE = _load_email_template("invitation.html")
+
+
+TRVEL_LOGO_URL = "https://www.trvel.co/android-chrome-192x192.png"
+VOXXCALLS_LOGO_URL = "https://www.voxxcalls.com/android-chrome-192x192.png"
+
+# Rendered bodies are pure functions of these text fields (the QR image is an
+# attachment), so retries and resends for the same order reuse the string
+EMAIL_RENDER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=EMAIL_RENDER_CACHE_SIZE)
+def _render_qr_email_html(
+    first_name: str,
+    order_number: str,
+    destination: str,
+    plan_name: str,
+    duration_days: int,
+) -> str:
+    return _QR_EMAIL_TEMPLATE.format_map(
+        {
+            "logo_url": TRVEL_LOGO_URL,
+            "first_name": first_name,
+            "order_number": order_number,
+            "destination": destination,
+            "plan_name": plan_name,
+            "duration_days": duration_days,
+        }
+    )
+
+
+@lru_cache(maxsize=EMAIL_RENDER_CACHE_SIZE)
+def _render_refund_email_html(
+    first_name: str,
+    order_number: str,
+    destination: str,
+    amount: float,
+    currency: str,
+) -> str:
+    return _REFUND_EMAIL_TEMPLATE.format_map(
+        {
+            "logo_url": TRVEL_LOGO_URL,
+            "first_name": first_name,
+            "order_number": order_number,
+            "destination": destination,
+            "amount": amount,
+            "currency": currency,
+        }
+    )
+
+
+def _encode_qr_attachment(qr_code_image: bytes) -> str:
+    """Base64 the QR PNG; Resend's JSON API only takes attachments as text."""
+    return binascii.b2a_base64(qr_code_image, newline=False).decode("ascii")
 
 class DeliveryService:
     """Service for multi-channel QR code delivery.
@@ -24,9 +194,16 @@ class DeliveryService:
         self.resend_api_key = settings.resend_api_key
         self.from_email = settings.resend_from_email
         self.from_name = settings.resend_from_name
+        self._http = get_resend_client()
+        self._from_field = f"{self.from_name} <{self.from_email}>"
+        # QR viewer page; send_qr_sms appends the order number
+        self._esim_url_prefix = f"{settings.api_base_url}/api/v1/esim/"
 
-        # Only initialize Twilio if credentials are provided
+        # Only initialize Twilio if credentials are provided; the SDK (requests,
+        # PyJWT, ...) is only imported by processes that can actually send SMS
         if settings.twilio_account_sid and settings.twilio_auth_token:
+            from twilio.rest import Client as TwilioClient
+
             self.twilio = TwilioClient(
                 settings.twilio_account_sid,
                 settings.twilio_auth_token,
@@ -69,7 +246,7 @@ class DeliveryService:
                 destination=destination,
                 plan_name=plan_name,
                 duration_days=duration_days,
-                qr_code_image=qr_code_image,
+                qr_code_image_b64=_encode_qr_attachment(qr_code_image),
                 activation_code=activation_code,
                 sm_dp_address=sm_dp_address,
             )
@@ -78,7 +255,7 @@ class DeliveryService:
             result["success"] = True
             result["message_id"] = email_result.get("message_id")
             return result
-        except Exception as e:
+        except _EMAIL_ERRORS as e:
             logger.warning("email_delivery_failed", email=customer_email, error=str(e))
             result["attempts"].append({"channel": "email", "success": False, "error": str(e)})
 
@@ -96,7 +273,7 @@ class DeliveryService:
                 result["success"] = True
                 result["message_id"] = sms_result.get("message_id")
                 return result
-            except Exception as e:
+            except _SMS_ERRORS as e:
                 logger.warning("sms_delivery_failed", phone=customer_phone, error=str(e))
                 result["attempts"].append({"channel": "sms", "success": False, "error": str(e)})
 
@@ -107,10 +284,34 @@ class DeliveryService:
         )
         return result
 
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-    )
+    async def _post_resend(
+        self,
+        *,
+        to: str,
+        subject: str,
+        html: str,
+        attachments: Optional[list[dict]] = None,
+        from_: Optional[str] = None,
+    ) -> Optional[str]:
+        """POST one email to Resend on the shared client; returns the message id."""
+        payload = {
+            "from": from_ or self._from_field,
+            "to": [to],
+            "subject": subject,
+            "html": html,
+        }
+        if attachments:
+            payload["attachments"] = attachments
+
+        return await self._send_resend_body(orjson.dumps(payload))
+
+    @_retry_resend
+    async def _send_resend_body(self, body: bytes) -> Optional[str]:
+        # Only the POST is retried; rendering and serialization happen once
+        response = await self._http.post("/emails", content=body)
+        response.raise_for_status()
+        return orjson.loads(response.content).get("id")
+
     async def send_qr_email(
         self,
         email: str,
@@ -119,193 +320,46 @@ class DeliveryService:
         destination: str,
         plan_name: str,
         duration_days: int,
-        qr_code_image: bytes,
+        qr_code_image_b64: str,
         activation_code: Optional[str] = None,
         sm_dp_address: Optional[str] = None,
     ) -> dict:
-        """Send QR code via email using Resend."""
-        first_name = name.split()[0] if name else "there"
-        logo_url = "https://www.trvel.co/android-chrome-192x192.png"
-
-        # HTML email template - matches trvel-website styling
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-</head>
-<body style="font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #010326; margin: 0; padding: 0; background-color: #fdfbf8;">
-  <div style="max-width: 600px; margin: 0 auto; padding: 24px 20px;">
-
-    <!-- Header with Logo -->
-    <div style="text-align: center; margin-bottom: 20px;">
-      <img src="{logo_url}" alt="Trvel" width="48" height="48" style="border-radius: 12px; margin-bottom: 8px;">
-      <h1 style="color: #63BFBF; font-size: 28px; margin: 0; font-weight: 700;">trvel</h1>
-    </div>
-
-    <!-- Main Card -->
-    <div style="background: white; border-radius: 24px; padding: 40px 32px; box-shadow: 0 4px 24px rgba(99, 191, 191, 0.15);">
-
-      <!-- Greeting -->
-      <p style="font-size: 18px; color: #010326; margin: 0 0 24px;">Hey {first_name}! 👋</p>
-
-      <!-- Success Message -->
-      <div style="background: linear-gradient(135deg, #63BFBF 0%, #75cfcf 100%); border-radius: 16px; padding: 24px; margin-bottom: 32px; text-align: center;">
-        <p style="color: white; font-size: 20px; font-weight: 600; margin: 0 0 8px;">Your eSIM is ready!</p>
-        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 15px;">Scan the QR code below to install</p>
-      </div>
-
-      <!-- Order Number Badge -->
-      <div style="text-align: center; margin-bottom: 32px;">
-        <span style="display: inline-block; background: #e8f7f7; border: 2px solid #63BFBF; color: #4fa9a9; padding: 8px 20px; border-radius: 100px; font-weight: 600; font-size: 14px; letter-spacing: 0.5px;">
-          Order {order_number}
-        </span>
-      </div>
-
-      <!-- QR Code Section -->
-      <div style="background: #fdfbf8; border-radius: 16px; padding: 24px; margin-bottom: 32px; text-align: center;">
-        <h3 style="font-size: 16px; color: #010326; margin: 0 0 16px; font-weight: 600;">📱 Your eSIM QR Code</h3>
-        <div style="background: white; border-radius: 12px; padding: 16px; display: inline-block; border: 2px solid #F2E2CE;">
-          <img src="cid:qrcode" alt="eSIM QR Code" width="200" height="200" style="display: block;">
-        </div>
-        <p style="margin: 16px 0 8px; color: #585b76; font-size: 13px;">Scan this code from another device (laptop/tablet)</p>
-      </div>
-
-      <!-- Detailed Installation Instructions -->
-      <div style="background: white; border: 2px solid #63BFBF; border-radius: 16px; padding: 24px; margin-bottom: 32px;">
-        <h3 style="font-size: 16px; color: #010326; margin: 0 0 20px; font-weight: 600;">📲 Step-by-step Installation</h3>
-
-        <!-- iPhone Instructions -->
-        <div style="margin-bottom: 20px;">
-          <p style="margin: 0 0 12px; color: #010326; font-weight: 600; font-size: 14px;"> iPhone (iOS 17.4+)</p>
-          <ol style="margin: 0; padding-left: 20px; color: #585b76; font-size: 14px; line-height: 1.8;">
-            <li>Open <strong>Settings</strong> → <strong>Mobile Data</strong> → <strong>Add eSIM</strong></li>
-            <li>Tap <strong>"Use QR Code"</strong></li>
-            <li>Point camera at the QR code above</li>
-            <li>Tap <strong>"Add eSIM"</strong> when prompted</li>
-            <li>Label it as "Travel" or "{destination}"</li>
-          </ol>
-        </div>
-
-        <!-- Android Instructions -->
-        <div style="margin-bottom: 20px;">
-          <p style="margin: 0 0 12px; color: #010326; font-weight: 600; font-size: 14px;">🤖 Android</p>
-          <ol style="margin: 0; padding-left: 20px; color: #585b76; font-size: 14px; line-height: 1.8;">
-            <li>Open <strong>Settings</strong> → <strong>Network & Internet</strong> → <strong>SIMs</strong></li>
-            <li>Tap <strong>"Add eSIM"</strong> or <strong>"+"</strong></li>
-            <li>Select <strong>"Scan QR code"</strong></li>
-            <li>Point camera at the QR code above</li>
-            <li>Follow prompts to complete setup</li>
-          </ol>
-        </div>
-
-        <!-- Pro Tips -->
-        <div style="background: #e8f7f7; border-radius: 12px; padding: 16px;">
-          <p style="margin: 0 0 8px; color: #4fa9a9; font-weight: 600; font-size: 14px;">💡 Pro Tips</p>
-          <ul style="margin: 0; padding-left: 18px; color: #585b76; font-size: 13px; line-height: 1.7;">
-            <li><strong>Install before you travel</strong> - Set it up on WiFi at home</li>
-            <li><strong>Don't delete it!</strong> - The QR code can only be used once</li>
-            <li><strong>When you land:</strong> Turn on <strong>Data Roaming</strong> for the eSIM</li>
-            <li>Your data plan starts when you first connect to a network in {destination}</li>
-          </ul>
-        </div>
-      </div>
-
-      <!-- Order Details -->
-      <div style="background: #fdfbf8; border-radius: 16px; padding: 24px; margin-bottom: 32px;">
-        <table style="width: 100%; border-collapse: collapse;">
-          <tr>
-            <td style="color: #585b76; padding: 12px 0; border-bottom: 1px solid #F2E2CE; font-size: 15px;">Destination</td>
-            <td style="font-weight: 600; color: #010326; text-align: right; padding: 12px 0; border-bottom: 1px solid #F2E2CE; font-size: 15px;">🌏 {destination}</td>
-          </tr>
-          <tr>
-            <td style="color: #585b76; padding: 12px 0; border-bottom: 1px solid #F2E2CE; font-size: 15px;">Plan</td>
-            <td style="font-weight: 600; color: #010326; text-align: right; padding: 12px 0; border-bottom: 1px solid #F2E2CE; font-size: 15px;">{plan_name} ({duration_days} days)</td>
-          </tr>
-          <tr>
-            <td style="color: #585b76; padding: 12px 0; font-size: 15px;">Data</td>
-            <td style="font-weight: 600; color: #63BFBF; text-align: right; padding: 12px 0; font-size: 15px;">Unlimited</td>
-          </tr>
-        </table>
-      </div>
-
-      <!-- Support Card -->
-      <div style="background: linear-gradient(135deg, #F2E2CE 0%, #f7efe4 100%); border-radius: 16px; padding: 20px; text-align: center;">
-        <p style="margin: 0 0 4px; color: #010326; font-weight: 600;">Questions? I'm here to help!</p>
-        <p style="margin: 0; color: #585b76; font-size: 14px;">
-          Reply to this email or call us on +61 3 4052 7555
-        </p>
-      </div>
-    </div>
-
-    <!-- Personal Sign-off -->
-    <div style="margin-top: 32px; padding: 0 8px;">
-      <p style="color: #585b76; margin: 0 0 16px; font-size: 15px;">
-        Thanks for choosing Trvel for your {destination} trip! If you have any questions at all, just reply to this email - I personally read and respond to every message.
-      </p>
-      <p style="color: #010326; margin: 0; font-weight: 500;">
-        Safe travels! ✈️<br>
-        <span style="color: #63BFBF; font-weight: 600;">Jonathan</span><br>
-        <span style="color: #585b76; font-size: 14px; font-weight: 400;">Founder of Trvel</span>
-      </p>
-    </div>
-
-    <!-- Footer -->
-    <div style="text-align: center; margin-top: 40px; padding-top: 24px; border-top: 1px solid #F2E2CE;">
-      <p style="color: #888a9d; font-size: 12px; margin: 0;">
-        Trvel • Travel eSIMs made simple<br>
-        <a href="https://www.trvel.co" style="color: #63BFBF; text-decoration: none;">trvel.co</a>
-      </p>
-    </div>
-  </div>
-</body>
-</html>"""
-
-        # Encode QR code image as base64
-        encoded_qr = base64.b64encode(qr_code_image).decode()
-
-        # Send via Resend API
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.resend.com/emails",
-                headers={
-                    "Authorization": f"Bearer {self.resend_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "from": f"{self.from_name} <{self.from_email}>",
-                    "to": [email],
-                    "subject": f"Your {destination} eSIM is ready! ✈️",
-                    "html": html_content,
-                    "attachments": [
-                        {
-                            "filename": "esim-qr-code.png",
-                            "content": encoded_qr,
-                            "content_id": "qrcode",
-                        }
-                    ],
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        """Send QR code via email using Resend.
+
+        The QR PNG arrives already base64-encoded (see _encode_qr_attachment),
+        so retries don't re-encode it.
+        """
+        first_name = name.partition(" ")[0] if name else "there"
+        html_content = _render_qr_email_html(
+            first_name, order_number, destination, plan_name, duration_days
+        )
+
+        message_id = await self._post_resend(
+            to=email,
+            subject=f"Your {destination} eSIM is ready! ✈️",
+            html=html_content,
+            attachments=[
+                {
+                    "filename": "esim-qr-code.png",
+                    "content": qr_code_image_b64,
+                    "content_id": "qrcode",
+                }
+            ],
+        )
 
         logger.info(
             "email_sent",
             email=email,
             order_number=order_number,
-            message_id=data.get("id"),
+            message_id=message_id,
         )
 
         return {
             "success": True,
-            "message_id": data.get("id"),
+            "message_id": message_id,
         }
 
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-    )
+    @_retry_twilio
     async def send_qr_sms(
         self,
         phone: str,
@@ -314,21 +368,19 @@ class DeliveryService:
         qr_code_data: str,
     ) -> dict:
         """Send QR code link via SMS."""
-        # Build the QR viewer URL
-        qr_viewer_url = f"{settings.api_base_url}/api/v1/esim/{order_number}"
-
-        # SMS has character limits, so send a link
-        message_body = (
-            f"Trvel: Your {destination} eSIM is ready!\n\n"
-            f"View & scan your QR code:\n"
-            f"{qr_viewer_url}\n\n"
-            f"10-min connection guarantee."
-        )
-
-        message = self.twilio.messages.create(
-            body=message_body,
-            from_=settings.twilio_phone_number,
-            to=phone,
+        qr_viewer_url = self._esim_url_prefix + order_number
+
+        message_body = _QR_SMS_TEMPLATE.format(destination=destination, url=qr_viewer_url)
+
+        # The Twilio client is synchronous; keep its round-trip off the event loop
+        message = await asyncio.get_running_loop().run_in_executor(
+            _twilio_executor,
+            partial(
+                self.twilio.messages.create,
+                body=message_body,
+                from_=settings.twilio_phone_number,
+                to=phone,
+            ),
         )
 
         logger.info(
@@ -339,7 +391,7 @@ class DeliveryService:
         )
 
         return {
-            "success": message.status in ["queued", "sent"],
+            "success": message.status in _SMS_OK_STATUSES,
             "message_id": message.sid,
         }
 
@@ -382,7 +434,7 @@ class DeliveryService:
                     destination=destination,
                     plan_name=plan_name,
                     duration_days=duration_days,
-                    qr_code_image=qr_code_image,
+                    qr_code_image_b64=_encode_qr_attachment(qr_code_image),
                     activation_code=activation_code,
                     sm_dp_address=sm_dp_address,
                 )
@@ -396,7 +448,7 @@ class DeliveryService:
                     email=customer_email,
                 )
                 return result
-            except Exception as e:
+            except _EMAIL_ERRORS as e:
                 logger.error("qr_resend_email_failed", order_number=order_number, error=str(e))
                 result["message"] = f"Failed to send email: {str(e)}"
                 return result
@@ -426,7 +478,7 @@ class DeliveryService:
                     phone_last4=customer_phone[-4:],
                 )
                 return result
-            except Exception as e:
+            except _SMS_ERRORS as e:
                 logger.error("qr_resend_sms_failed", order_number=order_number, error=str(e))
                 result["message"] = f"Failed to send SMS: {str(e)}"
                 return result
@@ -470,142 +522,50 @@ class DeliveryService:
         reason: str,
     ) -> dict:
         """Send refund confirmation email - styled to match Trvel branding."""
-        first_name = name.split()[0] if name else "there"
-        logo_url = "https://www.trvel.co/android-chrome-192x192.png"
-
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-</head>
-<body style="font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #010326; margin: 0; padding: 0; background-color: #fdfbf8;">
-  <div style="max-width: 600px; margin: 0 auto; padding: 24px 20px;">
-
-    <!-- Header with Logo -->
-    <div style="text-align: center; margin-bottom: 20px;">
-      <img src="{logo_url}" alt="Trvel" width="48" height="48" style="border-radius: 12px; margin-bottom: 8px;">
-      <h1 style="color: #63BFBF; font-size: 28px; margin: 0; font-weight: 700;">trvel</h1>
-    </div>
-
-    <!-- Main Card -->
-    <div style="background: white; border-radius: 24px; padding: 40px 32px; box-shadow: 0 4px 24px rgba(99, 191, 191, 0.15);">
-
-      <!-- Greeting -->
-      <p style="font-size: 18px; color: #010326; margin: 0 0 24px;">Hey {first_name},</p>
-
-      <!-- Refund Confirmation Banner -->
-      <div style="background: linear-gradient(135deg, #63BFBF 0%, #75cfcf 100%); border-radius: 16px; padding: 24px; margin-bottom: 32px; text-align: center;">
-        <p style="color: white; font-size: 20px; font-weight: 600; margin: 0 0 8px;">Refund Processed ✓</p>
-        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 15px;">Your money is on its way back</p>
-      </div>
-
-      <!-- Refund Details -->
-      <div style="background: #fdfbf8; border-radius: 16px; padding: 24px; margin-bottom: 32px;">
-        <table style="width: 100%; border-collapse: collapse;">
-          <tr>
-            <td style="color: #585b76; padding: 12px 0; border-bottom: 1px solid #F2E2CE; font-size: 15px;">Order Number</td>
-            <td style="font-weight: 600; color: #010326; text-align: right; padding: 12px 0; border-bottom: 1px solid #F2E2CE; font-size: 15px;">{order_number}</td>
-          </tr>
-          <tr>
-            <td style="color: #585b76; padding: 12px 0; border-bottom: 1px solid #F2E2CE; font-size: 15px;">Plan</td>
-            <td style="font-weight: 600; color: #010326; text-align: right; padding: 12px 0; border-bottom: 1px solid #F2E2CE; font-size: 15px;">🌏 {destination}</td>
-          </tr>
-          <tr>
-            <td style="color: #585b76; padding: 12px 0; font-size: 15px;">Refund Amount</td>
-            <td style="font-weight: 600; color: #63BFBF; text-align: right; padding: 12px 0; font-size: 18px;">${amount:.2f} {currency}</td>
-          </tr>
-        </table>
-      </div>
-
-      <!-- Timeline -->
-      <div style="background: #e8f7f7; border-radius: 12px; padding: 20px; margin-bottom: 32px;">
-        <p style="margin: 0 0 8px; color: #4fa9a9; font-weight: 600; font-size: 14px;">⏱️ What happens next?</p>
-        <p style="margin: 0; color: #585b76; font-size: 14px; line-height: 1.7;">
-          Your refund has been processed and will appear in your account within <strong>5-10 business days</strong>, depending on your bank or card provider.
-        </p>
-      </div>
-
-      <!-- Message -->
-      <p style="color: #585b76; font-size: 15px; margin: 0 0 24px; line-height: 1.7;">
-        We're sorry this plan didn't work out for your trip. If there's anything we could have done better, just reply to this email—we'd love to hear your feedback.
-      </p>
-
-      <!-- CTA for future -->
-      <div style="background: linear-gradient(135deg, #F2E2CE 0%, #f7efe4 100%); border-radius: 16px; padding: 20px; text-align: center; margin-bottom: 24px;">
-        <p style="margin: 0 0 8px; color: #010326; font-weight: 600; font-size: 15px;">Planning another trip?</p>
-        <p style="margin: 0; color: #585b76; font-size: 14px;">
-          We'd love to help you stay connected. Use code <strong style="color: #63BFBF;">NEXTTRIP</strong> for 10% off your next order.
-        </p>
-      </div>
-
-      <!-- Support Card -->
-      <div style="text-align: center;">
-        <p style="margin: 0 0 4px; color: #010326; font-weight: 600;">Questions about your refund?</p>
-        <p style="margin: 0; color: #585b76; font-size: 14px;">
-          Email <a href="mailto:support@trvel.co" style="color: #63BFBF; text-decoration: none;">support@trvel.co</a> or call <a href="tel:+61340527555" style="color: #63BFBF; text-decoration: none;">+61 3 4052 7555</a>
-        </p>
-      </div>
-    </div>
-
-    <!-- Personal Sign-off -->
-    <div style="margin-top: 32px; padding: 0 8px;">
-      <p style="color: #585b76; margin: 0 0 16px; font-size: 15px;">
-        Thanks for giving Trvel a try. We hope to help you stay connected on a future adventure!
-      </p>
-      <p style="color: #010326; margin: 0; font-weight: 500;">
-        Safe travels! ✈️<br>
-        <span style="color: #63BFBF; font-weight: 600;">Jonathan</span><br>
-        <span style="color: #585b76; font-size: 14px; font-weight: 400;">Founder of Trvel</span>
-      </p>
-    </div>
-
-    <!-- Footer -->
-    <div style="text-align: center; margin-top: 40px; padding-top: 24px; border-top: 1px solid #F2E2CE;">
-      <p style="color: #888a9d; font-size: 12px; margin: 0;">
-        Trvel • Travel eSIMs made simple<br>
-        <a href="https://www.trvel.co" style="color: #63BFBF; text-decoration: none;">trvel.co</a>
-      </p>
-    </div>
-  </div>
-</body>
-</html>"""
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.resend.com/emails",
-                headers={
-                    "Authorization": f"Bearer {self.resend_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "from": f"{self.from_name} <{self.from_email}>",
-                    "to": [email],
-                    "subject": f"Refund Processed - {destination} eSIM",
-                    "html": html_content,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        first_name = name.partition(" ")[0] if name else "there"
+        html_content = _render_refund_email_html(
+            first_name, order_number, destination, amount, currency
+        )
+
+        message_id = await self._post_resend(
+            to=email,
+            subject=f"Refund Processed - {destination} eSIM",
+            html=html_content,
+        )
 
         logger.info(
             "refund_email_sent",
             email=email,
             order_number=order_number,
             amount=amount,
-            message_id=data.get("id"),
+            message_id=message_id,
         )
 
         return {
             "success": True,
-            "message_id": data.get("id"),
+            "message_id": message_id,
         }
 
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-    )
+    def schedule_refund_notification(self, **kwargs) -> None:
+        """Send the refund email in the background; failures are logged, not raised.
+
+        Takes the same keyword arguments as send_refund_notification. Use it when
+        the caller doesn't need the Resend message id before responding.
+        """
+        task = asyncio.create_task(self._send_refund_notification_logged(**kwargs))
+        _notification_tasks.add(task)
+        task.add_done_callback(_notification_tasks.discard)
+
+    async def _send_refund_notification_logged(self, **kwargs) -> None:
+        try:
+            await self.send_refund_notification(**kwargs)
+        except Exception as e:
+            logger.error(
+                "refund_email_failed",
+                order_number=kwargs.get("order_number"),
+                error=str(e),
+            )
+
     async def send_invitation_email(
         self,
         email: str,
@@ -618,98 +578,33 @@ class DeliveryService:
         # Build the signup URL with invite token
         base_url = getattr(settings, 'frontend_url', "https://voxxcalls.com")
         invite_url = f"{base_url}/signup?invite={invite_token}"
-        logo_url = "https://www.voxxcalls.com/android-chrome-192x192.png"
         role_display = "an administrator" if role == "admin" else "a team member"
 
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-</head>
-<body style="font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #1a1a2e; margin: 0; padding: 0; background-color: #f8fafc;">
-  <div style="max-width: 600px; margin: 0 auto; padding: 24px 20px;">
-
-    <!-- Header with Logo -->
-    <div style="text-align: center; margin-bottom: 20px;">
-      <img src="{logo_url}" alt="VoxxCalls" width="48" height="48" style="border-radius: 12px; margin-bottom: 8px;">
-      <h1 style="color: #6366f1; font-size: 28px; margin: 0; font-weight: 700;">VoxxCalls</h1>
-    </div>
-
-    <!-- Main Card -->
-    <div style="background: white; border-radius: 24px; padding: 40px 32px; box-shadow: 0 4px 24px rgba(99, 102, 241, 0.1);">
-
-      <!-- Invitation Banner -->
-      <div style="background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%); border-radius: 16px; padding: 24px; margin-bottom: 32px; text-align: center;">
-        <p style="color: white; font-size: 20px; font-weight: 600; margin: 0 0 8px;">You're Invited!</p>
-        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 15px;">Join {organization_name} on VoxxCalls</p>
-      </div>
-
-      <!-- Message -->
-      <p style="font-size: 16px; color: #1a1a2e; margin: 0 0 24px;">
-        <strong>{inviter_name}</strong> has invited you to join <strong>{organization_name}</strong> as {role_display}.
-      </p>
-
-      <p style="font-size: 15px; color: #64748b; margin: 0 0 32px;">
-        VoxxCalls helps teams manage AI-powered voice agents. Click the button below to create your account and get started.
-      </p>
-
-      <!-- CTA Button -->
-      <div style="text-align: center; margin-bottom: 32px;">
-        <a href="{invite_url}" style="display: inline-block; background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%); color: white; text-decoration: none; padding: 16px 32px; border-radius: 12px; font-weight: 600; font-size: 16px;">
-          Accept Invitation
-        </a>
-      </div>
-
-      <!-- Link fallback -->
-      <div style="background: #f8fafc; border-radius: 12px; padding: 16px; margin-bottom: 24px;">
-        <p style="margin: 0 0 8px; color: #64748b; font-size: 13px;">Or copy and paste this link:</p>
-        <p style="margin: 0; color: #6366f1; font-size: 13px; word-break: break-all;">{invite_url}</p>
-      </div>
-
-      <!-- Expiry notice -->
-      <p style="color: #94a3b8; font-size: 13px; margin: 0; text-align: center;">
-        This invitation expires in 7 days.
-      </p>
-    </div>
-
-    <!-- Footer -->
-    <div style="text-align: center; margin-top: 40px; padding-top: 24px; border-top: 1px solid #e2e8f0;">
-      <p style="color: #94a3b8; font-size: 12px; margin: 0;">
-        VoxxCalls - AI Voice Agents<br>
-        <a href="https://voxxcalls.com" style="color: #6366f1; text-decoration: none;">voxxcalls.com</a>
-      </p>
-    </div>
-  </div>
-</body>
-</html>"""
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.resend.com/emails",
-                headers={
-                    "Authorization": f"Bearer {self.resend_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "from": f"VoxxCalls <{self.from_email}>",
-                    "to": [email],
-                    "subject": f"You're invited to join {organization_name} on VoxxCalls",
-                    "html": html_content,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        html_content = _INVITATION_EMAIL_TEMPLATE.format_map(
+            {
+                "logo_url": VOXXCALLS_LOGO_URL,
+                "organization_name": organization_name,
+                "inviter_name": inviter_name,
+                "role_display": role_display,
+                "invite_url": invite_url,
+            }
+        )
+
+        message_id = await self._post_resend(
+            to=email,
+            subject=f"You're invited to join {organization_name} on VoxxCalls",
+            html=html_content,
+            from_=f"VoxxCalls <{self.from_email}>",
+        )
 
         logger.info(
             "invitation_email_sent",
             email=email,
             organization=organization_name,
-            message_id=data.get("id"),
+            message_id=message_id,
         )
 
         return {
             "success": True,
-            "message_id": data.get("id"),
+            "message_id": message_id,
         }
@@ -1,9 +1,11 @@
 """eSIM provisioning service for eSIM Go."""
 
+import asyncio
 import io
 from typing import Optional
 
 import httpx
+import orjson
 import qrcode
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -12,6 +14,41 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+ESIMGO_API_URL = "https://api.esim-go.com/v2.5"
+
+# Shared eSIM Go client (singleton): provisioning, status polls and refunds
+# all hit one host, so they reuse one keep-alive pool across ESimService
+# instances instead of a TCP+TLS handshake per call
+_esimgo_client: httpx.AsyncClient | None = None
+
+
+def get_esimgo_client() -> httpx.AsyncClient:
+    """Get or create the shared eSIM Go HTTP client."""
+    global _esimgo_client
+
+    if _esimgo_client is None:
+        _esimgo_client = httpx.AsyncClient(
+            base_url=ESIMGO_API_URL,
+            headers={
+                "X-API-Key": settings.esimgo_api_key,
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Concurrent provisions and status polls multiplex over one connection
+            http2=True,
+        )
+    return _esimgo_client
+
+
+async def close_esimgo_client() -> None:
+    """Close the shared eSIM Go HTTP client."""
+    global _esimgo_client
+
+    if _esimgo_client is not None:
+        await _esimgo_client.aclose()
+        _esimgo_client = None
+
 
 class ESimService:
     """eSIM provisioning service using eSIM Go.
@@ -19,17 +56,9 @@ class ESimService:
     Critical path operation - must complete within seconds.
     """
 
-    API_BASE_URL = "https://api.esim-go.com/v2.5"
-
     def __init__(self):
         self.api_key = settings.esimgo_api_key
-
-    def _get_headers(self) -> dict:
-        """Get API request headers."""
-        return {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-        }
+        self._http = get_esimgo_client()
 
     @retry(
         stop=stop_after_attempt(3),
@@ -55,93 +84,87 @@ class ESimService:
             order_reference=order_reference,
         )
 
-        async with httpx.AsyncClient() as client:
-            # Apply bundle to get eSIM
-            response = await client.post(
-                f"{self.API_BASE_URL}/esims/apply",
-                headers=self._get_headers(),
-                json={
-                    "type": "bundle",
-                    "bundle": bundle_name,
-                    "startTime": "now",
-                    "Order": order_reference or "",
-                },
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        # Apply bundle to get eSIM
+        response = await self._http.post(
+            "/esims/apply",
+            json={
+                "type": "bundle",
+                "bundle": bundle_name,
+                "startTime": "now",
+                "Order": order_reference or "",
+            },
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-            esim = data.get("esim", {})
-            iccid = esim.get("iccid")
+        esim = data.get("esim", {})
+        iccid = esim.get("iccid")
 
-            # Get QR code data
-            qr_data = await self._get_qr_code_data(iccid)
+        # Get QR code data
+        qr_data = await self._get_qr_code_data(iccid)
 
-            result = {
-                "provider": "esim_go",
-                "provider_order_id": data.get("orderReference"),
-                "provider_esim_id": esim.get("reference"),
-                "iccid": iccid,
-                "qr_code_data": qr_data.get("qrCodeData"),
-                "qr_code_url": qr_data.get("qrCodeUrl"),
-                "activation_code": qr_data.get("activationCode"),
-                "sm_dp_address": qr_data.get("smdpAddress"),
-                "raw_response": data,
-            }
+        result = {
+            "provider": "esim_go",
+            "provider_order_id": data.get("orderReference"),
+            "provider_esim_id": esim.get("reference"),
+            "iccid": iccid,
+            "qr_code_data": qr_data.get("qrCodeData"),
+            "qr_code_url": qr_data.get("qrCodeUrl"),
+            "activation_code": qr_data.get("activationCode"),
+            "sm_dp_address": qr_data.get("smdpAddress"),
+            "raw_response": data,
+        }
 
-            # Generate QR code image
-            if result.get("qr_code_data"):
-                result["qr_code_image"] = self._generate_qr_image(result["qr_code_data"])
+        # Generate QR code image
+        if result.get("qr_code_data"):
+            result["qr_code_image"] = await self.generate_qr_image(result["qr_code_data"])
 
-            logger.info(
-                "esim_provisioned",
-                iccid=iccid,
-                order_reference=order_reference,
-            )
+        logger.info(
+            "esim_provisioned",
+            iccid=iccid,
+            order_reference=order_reference,
+        )
 
-            return result
+        return result
 
     async def _get_qr_code_data(self, iccid: str) -> dict:
         """Get QR code data for an eSIM."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.API_BASE_URL}/esims/{iccid}",
-                headers=self._get_headers(),
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._http.get(
+            f"/esims/{iccid}",
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-            return {
-                "qrCodeData": data.get("qrCodeData") or data.get("lpaString"),
-                "qrCodeUrl": data.get("qrCodeUrl"),
-                "activationCode": data.get("activationCode") or data.get("matchingId"),
-                "smdpAddress": data.get("smdpAddress") or data.get("smdp"),
-            }
+        return {
+            "qrCodeData": data.get("qrCodeData") or data.get("lpaString"),
+            "qrCodeUrl": data.get("qrCodeUrl"),
+            "activationCode": data.get("activationCode") or data.get("matchingId"),
+            "smdpAddress": data.get("smdpAddress") or data.get("smdp"),
+        }
 
     async def get_esim_status(self, iccid: str) -> dict:
         """Get eSIM activation and usage status.
 
         Used for 10-minute connection guarantee monitoring.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.API_BASE_URL}/esims/{iccid}",
-                headers=self._get_headers(),
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._http.get(
+            f"/esims/{iccid}",
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-            status = data.get("status", "").lower()
-            return {
-                "status": status,
-                "activated": status in ["active", "installed", "in_use"],
-                "data_used_mb": data.get("dataUsed", 0) / (1024 * 1024) if data.get("dataUsed") else 0,
-                "data_limit_mb": data.get("dataLimit", 0) / (1024 * 1024) if data.get("dataLimit") else None,
-                "expiry_date": data.get("expiryDate"),
-                "raw_response": data,
-            }
+        status = data.get("status", "").lower()
+        return {
+            "status": status,
+            "activated": status in ["active", "installed", "in_use"],
+            "data_used_mb": data.get("dataUsed", 0) / (1024 * 1024) if data.get("dataUsed") else 0,
+            "data_limit_mb": data.get("dataLimit", 0) / (1024 * 1024) if data.get("dataLimit") else None,
+            "expiry_date": data.get("expiryDate"),
+            "raw_response": data,
+        }
 
     async def check_activation_status(self, iccid: str) -> dict:
         """Check if an eSIM has been activated.
@@ -156,19 +179,17 @@ class ESimService:
         Args:
             country_code: Optional ISO country code to filter (e.g., "JP", "TH")
         """
-        async with httpx.AsyncClient() as client:
-            params = {}
-            if country_code:
-                params["country"] = country_code.upper()
-
-            response = await client.get(
-                f"{self.API_BASE_URL}/bundles",
-                headers=self._get_headers(),
-                params=params,
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            return response.json().get("bundles", [])
+        params = {}
+        if country_code:
+            params["country"] = country_code.upper()
+
+        response = await self._http.get(
+            "/bundles",
+            params=params,
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content).get("bundles", [])
 
     async def cancel_esim(self, iccid: str) -> bool:
         """Cancel/deactivate an eSIM (for refunds).
@@ -176,22 +197,20 @@ class ESimService:
         Note: Not all eSIMs can be cancelled depending on their state.
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(
-                    f"{self.API_BASE_URL}/esims/{iccid}",
-                    headers=self._get_headers(),
-                    timeout=10.0,
+            response = await self._http.delete(
+                f"/esims/{iccid}",
+                timeout=10.0,
+            )
+            if response.status_code == 200:
+                logger.info("esim_cancelled", iccid=iccid)
+                return True
+            else:
+                logger.warning(
+                    "esim_cancellation_failed",
+                    iccid=iccid,
+                    status=response.status_code,
                 )
-                if response.status_code == 200:
-                    logger.info("esim_cancelled", iccid=iccid)
-                    return True
-                else:
-                    logger.warning(
-                        "esim_cancellation_failed",
-                        iccid=iccid,
-                        status=response.status_code,
-                    )
-                    return False
+                return False
         except Exception as e:
             logger.error("esim_cancellation_error", iccid=iccid, error=str(e))
             return False
@@ -206,21 +225,19 @@ class ESimService:
         Endpoint: GET /esims/{iccid}/bundles
         Used to find the bundle name and assignment ID for revocation.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.API_BASE_URL}/esims/{iccid}/bundles",
-                headers=self._get_headers(),
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._http.get(
+            f"/esims/{iccid}/bundles",
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-            bundles = data.get("bundles", [])
-            return {
-                "bundles": bundles,
-                "count": len(bundles),
-                "raw_response": data,
-            }
+        bundles = data.get("bundles", [])
+        return {
+            "bundles": bundles,
+            "count": len(bundles),
+            "raw_response": data,
+        }
 
     async def check_esim_data_usage(self, iccid: str) -> dict:
         """Check if eSIM has consumed any data.
@@ -228,13 +245,15 @@ class ESimService:
         Returns eligibility for refund based on data usage.
         If any data has been used, eSIM is NOT eligible for refund.
         """
-        status = await self.get_esim_status(iccid)
+        # Independent lookups; fetch the eSIM and its bundles concurrently
+        status, bundles_info = await asyncio.gather(
+            self.get_esim_status(iccid),
+            self.get_esim_bundles_applied(iccid),
+        )
 
         data_used_bytes = status.get("raw_response", {}).get("dataUsed", 0)
         data_used_mb = data_used_bytes / (1024 * 1024) if data_used_bytes else 0
 
-        # Get bundle info for more details
-        bundles_info = await self.get_esim_bundles_applied(iccid)
         bundles = bundles_info.get("bundles", [])
 
         # Check if any bundle has started (has data usage)
@@ -274,40 +293,38 @@ class ESimService:
             dict with success status and details
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(
-                    f"{self.API_BASE_URL}/esims/{iccid}/bundles/{bundle_name}",
-                    headers=self._get_headers(),
-                    timeout=15.0,
-                )
+            response = await self._http.delete(
+                f"/esims/{iccid}/bundles/{bundle_name}",
+                timeout=15.0,
+            )
 
-                if response.status_code in [200, 204]:
-                    logger.info(
-                        "bundle_revoked",
-                        iccid=iccid,
-                        bundle_name=bundle_name,
-                    )
-                    return {
-                        "success": True,
-                        "iccid": iccid,
-                        "bundle_name": bundle_name,
-                        "message": "Bundle revoked and returned to inventory",
-                    }
-                else:
-                    error_data = response.json() if response.content else {}
-                    logger.warning(
-                        "bundle_revocation_failed",
-                        iccid=iccid,
-                        bundle_name=bundle_name,
-                        status=response.status_code,
-                        error=error_data,
-                    )
-                    return {
-                        "success": False,
-                        "iccid": iccid,
-                        "bundle_name": bundle_name,
-                        "error": error_data.get("message", f"HTTP {response.status_code}"),
-                    }
+            if response.status_code in [200, 204]:
+                logger.info(
+                    "bundle_revoked",
+                    iccid=iccid,
+                    bundle_name=bundle_name,
+                )
+                return {
+                    "success": True,
+                    "iccid": iccid,
+                    "bundle_name": bundle_name,
+                    "message": "Bundle revoked and returned to inventory",
+                }
+            else:
+                error_data = orjson.loads(response.content) if response.content else {}
+                logger.warning(
+                    "bundle_revocation_failed",
+                    iccid=iccid,
+                    bundle_name=bundle_name,
+                    status=response.status_code,
+                    error=error_data,
+                )
+                return {
+                    "success": False,
+                    "iccid": iccid,
+                    "bundle_name": bundle_name,
+                    "error": error_data.get("message", f"HTTP {response.status_code}"),
+                }
         except Exception as e:
             logger.error(
                 "bundle_revocation_error",
@@ -331,26 +348,24 @@ class ESimService:
         Args:
             bundle_name: Optional filter by bundle name
         """
-        async with httpx.AsyncClient() as client:
-            params = {}
-            if bundle_name:
-                params["bundle"] = bundle_name
-
-            response = await client.get(
-                f"{self.API_BASE_URL}/inventory",
-                headers=self._get_headers(),
-                params=params,
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        params = {}
+        if bundle_name:
+            params["bundle"] = bundle_name
+
+        response = await self._http.get(
+            "/inventory",
+            params=params,
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-            inventory = data.get("inventory", [])
-            return {
-                "inventory": inventory,
-                "count": len(inventory),
-                "raw_response": data,
-            }
+        inventory = data.get("inventory", [])
+        return {
+            "inventory": inventory,
+            "count": len(inventory),
+            "raw_response": data,
+        }
 
     async def find_inventory_usage_id(self, bundle_name: str) -> Optional[str]:
         """Find the usageId for a specific bundle in inventory.
@@ -384,44 +399,42 @@ class ESimService:
         - Must be within permitted refund period (typically 60 days)
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.API_BASE_URL}/inventory/refund",
-                    headers=self._get_headers(),
-                    json={
-                        "usageId": usage_id,
-                        "quantity": quantity,
-                    },
-                    timeout=15.0,
-                )
+            response = await self._http.post(
+                "/inventory/refund",
+                json={
+                    "usageId": usage_id,
+                    "quantity": quantity,
+                },
+                timeout=15.0,
+            )
 
-                if response.status_code in [200, 201]:
-                    data = response.json() if response.content else {}
-                    logger.info(
-                        "bundle_refunded_to_balance",
-                        usage_id=usage_id,
-                        quantity=quantity,
-                    )
-                    return {
-                        "success": True,
-                        "usage_id": usage_id,
-                        "quantity": quantity,
-                        "message": "Bundle refunded to organization balance",
-                        "raw_response": data,
-                    }
-                else:
-                    error_data = response.json() if response.content else {}
-                    logger.warning(
-                        "bundle_refund_failed",
-                        usage_id=usage_id,
-                        status=response.status_code,
-                        error=error_data,
-                    )
-                    return {
-                        "success": False,
-                        "usage_id": usage_id,
-                        "error": error_data.get("message", f"HTTP {response.status_code}"),
-                    }
+            if response.status_code in [200, 201]:
+                data = orjson.loads(response.content) if response.content else {}
+                logger.info(
+                    "bundle_refunded_to_balance",
+                    usage_id=usage_id,
+                    quantity=quantity,
+                )
+                return {
+                    "success": True,
+                    "usage_id": usage_id,
+                    "quantity": quantity,
+                    "message": "Bundle refunded to organization balance",
+                    "raw_response": data,
+                }
+            else:
+                error_data = orjson.loads(response.content) if response.content else {}
+                logger.warning(
+                    "bundle_refund_failed",
+                    usage_id=usage_id,
+                    status=response.status_code,
+                    error=error_data,
+                )
+                return {
+                    "success": False,
+                    "usage_id": usage_id,
+                    "error": error_data.get("message", f"HTTP {response.status_code}"),
+                }
         except Exception as e:
             logger.error(
                 "bundle_refund_error",
@@ -500,6 +513,14 @@ class ESimService:
 
         return result
 
+    async def generate_qr_image(self, qr_data: str) -> bytes:
+        """Generate the QR code PNG on a worker thread.
+
+        Reed-Solomon encoding and PNG serialization are CPU-bound and would
+        otherwise stall every other request on the event loop.
+        """
+        return await asyncio.to_thread(self._generate_qr_image, qr_data)
+
     def _generate_qr_image(self, qr_data: str) -> bytes:
         """Generate QR code image from data string."""
         qr = qrcode.QRCode(
@@ -513,5 +534,6 @@ class ESimService:
 
         img = qr.make_image(fill_color="black", back_color="white")
         buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
+        # Two-colour QR bitmaps barely benefit from heavier zlib effort
+        img.save(buffer, format="PNG", compress_level=1)
         return buffer.getvalue()
@@ -4,6 +4,8 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import orjson
+from cachetools import TTLCache
 from livekit import api
 from livekit.api import AccessToken, VideoGrants
 
@@ -12,6 +14,10 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Join tokens are valid for an hour; reuse one for at most five minutes
+ROOM_TOKEN_CACHE_TTL = timedelta(minutes=5)
+ROOM_TOKEN_CACHE_MAX_SIZE = 10_000
+
 
 class LiveKitService:
     """Service for managing LiveKit rooms and participants."""
@@ -20,6 +26,32 @@ class LiveKitService:
         self.api_key = settings.livekit_api_key
         self.api_secret = settings.livekit_api_secret
         self.url = settings.livekit_url
+        self._room_service: api.RoomService | None = None
+        # (room, identity, is_agent) -> signed join token
+        self._room_tokens: TTLCache[tuple[str, str, bool], str] = TTLCache(
+            maxsize=ROOM_TOKEN_CACHE_MAX_SIZE,
+            ttl=ROOM_TOKEN_CACHE_TTL.total_seconds(),
+        )
+
+    def _rooms(self) -> api.RoomService:
+        """Return the shared RoomService, creating it on first use.
+
+        Built lazily so its HTTP session is opened inside the running loop;
+        reusing it keeps the connection to the LiveKit server warm.
+        """
+        if self._room_service is None:
+            self._room_service = api.RoomService(
+                url=self.url,
+                api_key=self.api_key,
+                api_secret=self.api_secret,
+            )
+        return self._room_service
+
+    async def aclose(self) -> None:
+        """Close the RoomService HTTP session, if one was opened."""
+        if self._room_service is not None:
+            await self._room_service.aclose()
+            self._room_service = None
 
     def create_access_token(
         self,
@@ -54,7 +86,17 @@ class LiveKitService:
         participant_identity: str,
         is_agent: bool = False,
     ) -> str:
-        """Create a token for joining a room."""
+        """Create a token for joining a room.
+
+        Tokens are reused for ROOM_TOKEN_CACHE_TTL so reconnects skip the
+        signing; a cached token always has most of its one-hour TTL left.
+        """
+        key = (room_name, participant_identity, is_agent)
+        try:
+            return self._room_tokens[key]
+        except KeyError:
+            pass
+
         grants = VideoGrants(
             room_join=True,
             room=room_name,
@@ -64,11 +106,13 @@ class LiveKitService:
             hidden=is_agent,  # Agents can be hidden from participant list
         )
 
-        return self.create_access_token(
+        token = self.create_access_token(
             identity=participant_identity,
             room_name=room_name,
             grants=grants,
         )
+        self._room_tokens[key] = token
+        return token
 
     async def create_room(
         self,
@@ -78,18 +122,12 @@ class LiveKitService:
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Create a new LiveKit room."""
-        room_service = api.RoomService(
-            url=self.url,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-        )
-
-        room = await room_service.create_room(
+        room = await self._rooms().create_room(
             api.CreateRoomRequest(
                 name=room_name,
                 empty_timeout=empty_timeout,
                 max_participants=max_participants,
-                metadata=str(metadata) if metadata else None,
+                metadata=orjson.dumps(metadata).decode() if metadata else None,
             )
         )
 
@@ -104,24 +142,12 @@ class LiveKitService:
 
     async def delete_room(self, room_name: str) -> None:
         """Delete a LiveKit room."""
-        room_service = api.RoomService(
-            url=self.url,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-        )
-
-        await room_service.delete_room(api.DeleteRoomRequest(room=room_name))
+        await self._rooms().delete_room(api.DeleteRoomRequest(room=room_name))
         logger.info("LiveKit room deleted", room_name=room_name)
 
     async def list_rooms(self) -> list[dict[str, Any]]:
         """List all active rooms."""
-        room_service = api.RoomService(
-            url=self.url,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-        )
-
-        response = await room_service.list_rooms(api.ListRoomsRequest())
+        response = await self._rooms().list_rooms(api.ListRoomsRequest())
 
         return [
             {
@@ -135,13 +161,7 @@ class LiveKitService:
 
     async def list_participants(self, room_name: str) -> list[dict[str, Any]]:
         """List participants in a room."""
-        room_service = api.RoomService(
-            url=self.url,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-        )
-
-        response = await room_service.list_participants(
+        response = await self._rooms().list_participants(
             api.ListParticipantsRequest(room=room_name)
         )
 
@@ -158,13 +178,7 @@ class LiveKitService:
 
     async def remove_participant(self, room_name: str, identity: str) -> None:
         """Remove a participant from a room."""
-        room_service = api.RoomService(
-            url=self.url,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-        )
-
-        await room_service.remove_participant(
+        await self._rooms().remove_participant(
             api.RoomParticipantIdentity(room=room_name, identity=identity)
         )
         logger.info("Participant removed", room_name=room_name, identity=identity)
@@ -177,13 +191,7 @@ class LiveKitService:
         topic: str | None = None,
     ) -> None:
         """Send data message to room participants."""
-        room_service = api.RoomService(
-            url=self.url,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-        )
-
-        await room_service.send_data(
+        await self._rooms().send_data(
             api.SendDataRequest(
                 room=room_name,
                 data=data,
@@ -197,6 +205,23 @@ class LiveKitService:
         return f"call_{tenant_id}_{call_id}"
 
 
+# Singleton so every request shares one RoomService connection pool
+_livekit_service: LiveKitService | None = None
+
+
 def get_livekit_service() -> LiveKitService:
-    """Get LiveKit service instance."""
-    return LiveKitService()
+    """Get or create the shared LiveKit service instance."""
+    global _livekit_service
+
+    if _livekit_service is None:
+        _livekit_service = LiveKitService()
+    return _livekit_service
+
+
+async def close_livekit_service() -> None:
+    """Close the shared LiveKit service."""
+    global _livekit_service
+
+    if _livekit_service is not None:
+        await _livekit_service.aclose()
+        _livekit_service = None
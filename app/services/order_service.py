@@ -20,6 +20,8 @@ from app.schemas.order import (
     ProcessRefundErrorResponse,
     RefundRequest,
     RefundResponse,
+    RefundStep,
+    RefundStepDetails,
     RefundStepResult,
 )
 from app.services.delivery_service import DeliveryService
@@ -30,6 +32,19 @@ from app.services.stripe_service import StripeService
 logger = get_logger(__name__)
 
 
+def _refund_step(
+    step: RefundStep,
+    success: bool,
+    message: Optional[str] = None,
+    error: Optional[str] = None,
+    details: Optional[RefundStepDetails] = None,
+) -> RefundStepResult:
+    """Build a refund step result from values this service produced, unvalidated."""
+    return RefundStepResult.model_construct(
+        step=step, success=success, message=message, error=error, details=details
+    )
+
+
 class OrderService:
     """Service for order processing.
 
@@ -97,7 +112,7 @@ class OrderService:
         # Get customer for notification
         customer = await db.get(Customer, order.customer_id)
         if customer:
-            await self.delivery.send_refund_notification(
+            self.delivery.schedule_refund_notification(
                 email=customer.email,
                 name=customer.name or "Customer",
                 order_number=order.order_number,
@@ -142,7 +157,7 @@ class OrderService:
                 order_id=order_id,
                 order_number="",
                 status="failed",
-                errors=["Order not found"],
+                errors=("Order not found",),
             )
 
         result = OrderProcessingResult(
@@ -183,7 +198,7 @@ class OrderService:
             # Generate QR image
             qr_image = esim_data.get("qr_code_image")
             if not qr_image and esim_data.get("qr_code_data"):
-                qr_image = self.esim._generate_qr_image(esim_data["qr_code_data"])
+                qr_image = await self.esim.generate_qr_image(esim_data["qr_code_data"])
 
             # Deliver QR code
             delivery_result = await self.delivery.deliver_qr_code(
@@ -229,7 +244,7 @@ class OrderService:
                 )
 
             result.status = "completed" if result.qr_delivered else "partial"
-            result.errors = errors
+            result.errors = tuple(errors)
 
             logger.info(
                 "order_provisioned",
@@ -251,7 +266,7 @@ class OrderService:
 
             errors.append(str(e))
             result.status = "failed"
-            result.errors = errors
+            result.errors = tuple(errors)
             result.processing_time_ms = int((time.time() - start_time) * 1000)
 
             await self.notifications.alert_provisioning_failure(
@@ -355,15 +370,15 @@ class OrderService:
                 data_used_mb = usage_info.get("data_used_mb", 0)
                 eligible = usage_info.get("eligible_for_refund", False)
 
-                steps.append(RefundStepResult(
+                steps.append(_refund_step(
                     step="eligibility_check",
                     success=eligible or request.force,
                     message="eSIM not activated" if eligible else f"eSIM used {data_used_mb} MB",
-                    details={
-                        "data_used_mb": data_used_mb,
-                        "eligible": eligible,
-                        "force_override": request.force,
-                    },
+                    details=RefundStepDetails(
+                        data_used_mb=data_used_mb,
+                        eligible=eligible,
+                        force_override=request.force,
+                    ),
                 ))
 
                 # If eSIM was used and not forcing, deny refund
@@ -387,7 +402,7 @@ class OrderService:
                     iccid=order.esim_iccid,
                     error=str(e),
                 )
-                steps.append(RefundStepResult(
+                steps.append(_refund_step(
                     step="eligibility_check",
                     success=True,  # Proceed if we can't check
                     message=f"Could not verify eSIM status: {str(e)}. Proceeding with refund.",
@@ -401,12 +416,12 @@ class OrderService:
                         order.esim_iccid, order.bundle_name
                     )
                     esim_bundle_revoked = revoke_result.get("success", False)
-                    steps.append(RefundStepResult(
+                    steps.append(_refund_step(
                         step="bundle_revoke",
                         success=esim_bundle_revoked,
                         message=revoke_result.get("message", "Bundle revoked"),
                         error=revoke_result.get("error"),
-                        details={"iccid": order.esim_iccid, "bundle": order.bundle_name},
+                        details=RefundStepDetails(iccid=order.esim_iccid, bundle=order.bundle_name),
                     ))
 
                     # Step 3: Refund the bundle to organization balance
@@ -416,15 +431,15 @@ class OrderService:
                             if usage_id:
                                 refund_result = await self.esim.refund_bundle_to_balance(usage_id)
                                 esim_bundle_refunded = refund_result.get("success", False)
-                                steps.append(RefundStepResult(
+                                steps.append(_refund_step(
                                     step="bundle_refund",
                                     success=esim_bundle_refunded,
                                     message=refund_result.get("message", "Bundle refunded to balance"),
                                     error=refund_result.get("error"),
-                                    details={"usage_id": usage_id},
+                                    details=RefundStepDetails(usage_id=usage_id),
                                 ))
                             else:
-                                steps.append(RefundStepResult(
+                                steps.append(_refund_step(
                                     step="bundle_refund",
                                     success=False,
                                     message="Could not find bundle in inventory for refund",
@@ -436,7 +451,7 @@ class OrderService:
                                 order_id=order.id,
                                 error=str(e),
                             )
-                            steps.append(RefundStepResult(
+                            steps.append(_refund_step(
                                 step="bundle_refund",
                                 success=False,
                                 message="Bundle refund failed",
@@ -451,7 +466,7 @@ class OrderService:
                         bundle=order.bundle_name,
                         error=str(e),
                     )
-                    steps.append(RefundStepResult(
+                    steps.append(_refund_step(
                         step="bundle_revoke",
                         success=False,
                         message="Could not revoke bundle",
@@ -459,7 +474,7 @@ class OrderService:
                     ))
         else:
             # No eSIM provisioned yet, skip eSIM steps
-            steps.append(RefundStepResult(
+            steps.append(_refund_step(
                 step="eligibility_check",
                 success=True,
                 message="No eSIM provisioned - eligible for refund",
@@ -476,11 +491,11 @@ class OrderService:
             )
             stripe_refund_id = refund.id
 
-            steps.append(RefundStepResult(
+            steps.append(_refund_step(
                 step="stripe_refund",
                 success=True,
                 message=f"Payment refunded: {order.currency} ${order.amount_cents / 100:.2f}",
-                details={"refund_id": stripe_refund_id, "amount": order.amount_cents / 100},
+                details=RefundStepDetails(refund_id=stripe_refund_id, amount=order.amount_cents / 100),
             ))
 
         except Exception as e:
@@ -494,11 +509,11 @@ class OrderService:
                     payment_intent=order.stripe_payment_intent_id,
                 )
                 already_refunded_in_stripe = True
-                steps.append(RefundStepResult(
+                steps.append(_refund_step(
                     step="stripe_refund",
                     success=True,
                     message="Payment was already refunded in Stripe",
-                    details={"already_refunded": True},
+                    details=RefundStepDetails(already_refunded=True),
                 ))
             else:
                 logger.error(
@@ -539,7 +554,7 @@ class OrderService:
                     reason=request.reason or "Customer request",
                 )
                 email_sent = True
-                steps.append(RefundStepResult(
+                steps.append(_refund_step(
                     step="email_notification",
                     success=True,
                     message=f"Confirmation sent to {customer.email}",
@@ -550,7 +565,7 @@ class OrderService:
                     order_id=order.id,
                     error=str(e),
                 )
-                steps.append(RefundStepResult(
+                steps.append(_refund_step(
                     step="email_notification",
                     success=False,
                     message="Could not send confirmation email",
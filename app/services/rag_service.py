@@ -150,7 +150,7 @@ class RAGService:
             )
             raise
 
-    async def delete_document(self, document_id: uuid.UUID, user_id: str) -> None:
+    async def delete_document(self, document_id: uuid.UUID, user_id: uuid.UUID) -> None:
         """Delete all vectors for a document from Pinecone."""
         namespace = str(user_id)
 
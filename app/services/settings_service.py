@@ -0,0 +1,93 @@
+"""Per-process cache of tenant settings for the voice agent lookups."""
+
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from cachetools import TTLCache
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.models.settings import TenantSettings
+
+# Settings change on the order of hours; entries are also dropped when a
+# write commits
+SETTINGS_CACHE_TTL_SECONDS = 60
+SETTINGS_CACHE_MAX_SIZE = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class AgentSettings:
+    """Immutable snapshot of the TenantSettings columns the voice agent reads."""
+
+    llm_provider: str
+    llm_model: str
+    stt_provider: str
+    tts_provider: str
+    elevenlabs_voice_id: str
+    system_prompt: Optional[str]
+    welcome_message: str
+    max_conversation_turns: int
+    rag_enabled: bool
+    call_recording_enabled: bool
+    language: str
+    auto_detect_language: bool
+    min_silence_duration: float
+
+
+_AGENT_SETTINGS_COLUMNS = tuple(
+    getattr(TenantSettings, name) for name in AgentSettings.__dataclass_fields__
+)
+
+# user_id -> settings, or None when the user has no settings row
+_settings_cache: TTLCache[uuid.UUID, Optional[AgentSettings]] = TTLCache(
+    maxsize=SETTINGS_CACHE_MAX_SIZE, ttl=SETTINGS_CACHE_TTL_SECONDS
+)
+
+
+async def get_agent_settings(db: AsyncSession, user_id: uuid.UUID) -> Optional[AgentSettings]:
+    """Return the user's agent settings, hitting the database at most once per TTL."""
+    try:
+        return _settings_cache[user_id]
+    except KeyError:
+        pass
+
+    result = await db.execute(
+        select(*_AGENT_SETTINGS_COLUMNS).where(TenantSettings.user_id == user_id)
+    )
+    row = result.one_or_none()
+    settings = AgentSettings(*row) if row is not None else None
+    _settings_cache[user_id] = settings
+    return settings
+
+
+# Session.info key for user_ids whose settings this transaction has written
+_PENDING_INVALIDATION_KEY = "settings_cache_invalidate"
+
+
+@event.listens_for(TenantSettings, "after_insert")
+@event.listens_for(TenantSettings, "after_update")
+@event.listens_for(TenantSettings, "after_delete")
+def _record_settings_write(mapper, connection, target: TenantSettings) -> None:
+    """Remember the written row's user_id until its transaction commits.
+
+    These fire at flush, before the write is visible to other connections;
+    evicting here would let a concurrent lookup re-cache the old row.
+    """
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATION_KEY, set()).add(target.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_settings(session: Session) -> None:
+    """Drop cached snapshots for the settings rows this commit wrote."""
+    for user_id in session.info.pop(_PENDING_INVALIDATION_KEY, ()):
+        _settings_cache.pop(user_id, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    """Rolled-back writes never became visible, so the cache is still current."""
+    session.info.pop(_PENDING_INVALIDATION_KEY, None)
@@ -3,11 +3,13 @@
 from decimal import Decimal
 from typing import Optional
 
+import msgspec
 import stripe
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.schemas.webhook_fast import StripeWebhookEvent
 
 logger = get_logger(__name__)
 
@@ -169,13 +171,20 @@ class StripeService:
             )
             raise
 
-    def verify_webhook_signature(self, payload: bytes, signature: str) -> dict:
-        """Verify Stripe webhook signature and return event."""
+    def verify_webhook_signature(self, payload: bytes, signature: str) -> StripeWebhookEvent:
+        """Verify Stripe webhook signature and return event.
+
+        Only the signature check goes through the SDK; the body is decoded once
+        by msgspec instead of into a StripeObject tree.
+        """
         try:
-            event = stripe.Webhook.construct_event(
-                payload, signature, self.webhook_secret
+            stripe.WebhookSignature.verify_header(
+                payload.decode("utf-8"), signature, self.webhook_secret
             )
-            return event
+            return msgspec.json.decode(payload, type=StripeWebhookEvent)
+        except (msgspec.DecodeError, msgspec.ValidationError) as e:
+            logger.error("webhook_payload_invalid", error=str(e))
+            raise ValueError("Invalid webhook payload") from e
         except stripe.error.SignatureVerificationError as e:
             logger.error("webhook_signature_invalid", error=str(e))
             raise ValueError("Invalid webhook signature") from e
@@ -0,0 +1,157 @@
+"""Tests for the heap-backed delayed task scheduler in background_tasks."""
+
+import asyncio
+
+import pytest
+
+from app.services import background_tasks as bt
+
+# Short enough to keep the suite fast, far enough apart to order reliably
+TICK = 0.01
+
+
+@pytest.fixture(autouse=True)
+async def scheduler(monkeypatch):
+    """Give each test an empty scheduler bound to its own event loop."""
+    monkeypatch.setattr(bt, "_pending", [])
+    monkeypatch.setattr(bt, "_scheduled", {})
+    monkeypatch.setattr(bt, "_stale", 0)
+    monkeypatch.setattr(bt, "_wake", asyncio.Event())
+    monkeypatch.setattr(bt, "_dispatcher_task", None)
+    monkeypatch.setattr(bt, "_running", set())
+    yield bt
+    if bt._dispatcher_task is not None and not bt._dispatcher_task.done():
+        bt._dispatcher_task.cancel()
+        await asyncio.gather(bt._dispatcher_task, return_exceptions=True)
+
+
+def recorder(calls: list):
+    """An async task function that appends its argument to calls."""
+
+    async def record(value):
+        calls.append(value)
+
+    return record
+
+
+async def drain() -> None:
+    """Wait for the dispatcher to empty the heap and every fired call to finish."""
+    await bt._dispatcher_task
+    await asyncio.gather(*bt._running)
+
+
+async def test_tasks_fire_in_due_order():
+    calls = []
+    record = recorder(calls)
+
+    await bt.schedule_delayed_task("c", 3 * TICK, record, "c")
+    await bt.schedule_delayed_task("a", TICK, record, "a")
+    await bt.schedule_delayed_task("b", 2 * TICK, record, "b")
+    await drain()
+
+    assert calls == ["a", "b", "c"]
+    assert bt._scheduled == {}
+
+
+async def test_same_id_replaces_pending_task():
+    calls = []
+    record = recorder(calls)
+
+    await bt.schedule_delayed_task("order_1", TICK, record, "old")
+    await bt.schedule_delayed_task("order_1", 2 * TICK, record, "new")
+    assert bt._stale == 1
+    await drain()
+
+    assert calls == ["new"]
+    assert bt._stale == 0
+
+
+async def test_cancel_before_fire():
+    calls = []
+
+    await bt.schedule_delayed_task("order_1", TICK, recorder(calls), "fired")
+    assert bt.cancel_scheduled_task("order_1") is True
+    assert bt.cancel_scheduled_task("order_1") is False
+    await drain()
+
+    assert calls == []
+    assert bt._stale == 0
+
+
+async def test_cancel_unknown_task():
+    assert bt.cancel_scheduled_task("missing") is False
+    assert bt._stale == 0
+
+
+async def test_sooner_entry_wakes_sleeping_dispatcher():
+    calls = []
+    record = recorder(calls)
+
+    await bt.schedule_delayed_task("late", 60, record, "late")
+    await asyncio.sleep(TICK)  # dispatcher is now asleep until "late"
+    await bt.schedule_delayed_task("soon", TICK, record, "soon")
+    await asyncio.sleep(5 * TICK)
+
+    assert calls == ["soon"]
+    assert not bt._dispatcher_task.done()
+    assert list(bt._scheduled) == ["late"]
+
+
+async def test_dispatcher_restarts_after_heap_drains():
+    calls = []
+    record = recorder(calls)
+
+    await bt.schedule_delayed_task("first", TICK, record, "first")
+    first_dispatcher = bt._dispatcher_task
+    await drain()
+    assert first_dispatcher.done()
+
+    await bt.schedule_delayed_task("second", TICK, record, "second")
+    assert bt._dispatcher_task is not first_dispatcher
+    await drain()
+
+    assert calls == ["first", "second"]
+
+
+async def test_failing_task_does_not_stop_dispatcher():
+    calls = []
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    await bt.schedule_delayed_task("boom", TICK, boom)
+    await bt.schedule_delayed_task("after", 2 * TICK, recorder(calls), "after")
+    await drain()
+
+    assert calls == ["after"]
+
+
+async def test_stale_count_survives_compaction(monkeypatch):
+    monkeypatch.setattr(bt, "STALE_COMPACT_MIN", 4)
+    calls = []
+    record = recorder(calls)
+
+    for i in range(6):
+        await bt.schedule_delayed_task(f"t{i}", TICK, record, i)
+    for i in range(3):
+        bt.cancel_scheduled_task(f"t{i}")
+
+    # Three dead entries out of six: below the threshold, nothing rebuilt
+    assert bt._stale == 3
+    assert len(bt._pending) == 6
+
+    bt.cancel_scheduled_task("t3")
+
+    # The fourth makes them the majority: the heap keeps only live entries
+    assert bt._stale == 0
+    assert sorted(entry[2] for entry in bt._pending) == ["t4", "t5"]
+
+    # Dead entries created after the rebuild are still accounted for
+    await bt.schedule_delayed_task("t4", 2 * TICK, record, "t4-replaced")
+    assert bt._stale == 1
+    await drain()
+
+    assert calls == [5, "t4-replaced"]
+    assert bt._stale == 0
+    assert bt._pending == []
+    assert bt._scheduled == {}
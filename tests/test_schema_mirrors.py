@@ -0,0 +1,156 @@
+"""Parity between the msgspec mirrors and the Pydantic schemas they copy.
+
+Each mirror must put the same JSON on the wire (or decode the same body) as
+its documented Pydantic model, so every case runs one fixture through both.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from app.schemas import webhook_fast  # noqa: E402
+from app.schemas.checkout import CheckoutResponse  # noqa: E402
+from app.schemas.checkout_fast import CheckoutResponseFast, encode_checkout_response  # noqa: E402
+from app.schemas.customer import CustomerLookupResponse  # noqa: E402
+from app.schemas.customer_fast import CustomerLookupResponseFast, encode_lookup_response  # noqa: E402
+from app.schemas.order import OrderResponse  # noqa: E402
+from app.schemas.order_fast import OrderResponseFast, encode_order_response  # noqa: E402
+from app.schemas.webhook import ESIMProviderWebhook, StripeWebhookEvent  # noqa: E402
+
+CREATED = datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone.utc)
+PAID = datetime(2024, 1, 15, 10, 31, 5, tzinfo=timezone.utc)
+
+CHECKOUT = {
+    "success": True,
+    "checkout_url": "https://checkout.stripe.com/c/pay/cs_test_a1",
+    "session_id": "cs_test_a1",
+    "destination": "japan",
+    "destination_name": "Japan",
+    "duration": 7,
+    "plan_name": "Japan 7 Days",
+    "price": 29.99,
+    "currency": "AUD",
+    "message": "Here's your payment link for Japan 7 Days",
+    "timestamp": CREATED,
+}
+
+ESIM = {
+    "status": "provisioned",
+    "iccid": "8910300000000000001",
+    "smdp_address": "smdp.esim-go.com",
+    "matching_id": "ABC-123",
+    "qr_code": None,
+    "order_ref": "ref-1",
+    "provisioned_at": PAID,
+}
+
+ORDER = {
+    "id": 42,
+    "order_number": "TRV-20240115-001",
+    "customer_id": 7,
+    "status": "paid",
+    "destination_slug": "japan",
+    "destination_name": "Japan",
+    "plan_name": "Japan 7 Days",
+    "bundle_name": None,
+    "duration": 7,
+    "amount_cents": 2999,
+    "currency": "AUD",
+    "stripe_session_id": "cs_test_a1",
+    "stripe_payment_intent_id": None,
+    "esim": ESIM,
+    "locale": "en-au",
+    "createdAt": CREATED,
+    "updatedAt": PAID,
+    "paidAt": PAID,
+}
+
+LOOKUP = {
+    "success": True,
+    "customer": {
+        "id": 7,
+        "email": "traveller@example.com",
+        "name": "Sam Traveller",
+        "phone": None,
+        "stripe_customer_id": "cus_123",
+        "created_at": CREATED,
+    },
+    "orders": [
+        {
+            "id": 42,
+            "order_number": "TRV-20240115-001",
+            "destination": {"slug": "japan", "name": "Japan"},
+            "plan": {"name": "Japan 7 Days", "duration_days": 7},
+            "payment": {"cents": 2999, "amount": 29.99, "formatted": "$29.99 AUD"},
+            "status": "completed",
+            "esim": {"status": "active", "iccid": "8910300000000000001", "email_sent": True},
+            "created_at": CREATED,
+            "paid_at": PAID,
+        },
+        {
+            "id": 43,
+            "order_number": "TRV-20240116-002",
+            "destination": {"slug": "france", "name": "France"},
+            "plan": {"name": "France 3 Days", "duration_days": 3},
+            "payment": {"cents": 1500, "amount": 15.0, "formatted": "$15.00 AUD"},
+            "status": "pending",
+            "esim": {"status": None, "iccid": None, "email_sent": False},
+            "created_at": CREATED,
+            "paid_at": None,
+        },
+    ],
+    "summary": {"total_orders": 2, "completed_orders": 1, "total_spent": "$29.99"},
+    "timestamp": PAID,
+}
+
+
+@pytest.mark.parametrize(
+    ("fixture", "fast_type", "encode", "model"),
+    [
+        (CHECKOUT, CheckoutResponseFast, encode_checkout_response, CheckoutResponse),
+        (ORDER, OrderResponseFast, encode_order_response, OrderResponse),
+        (LOOKUP, CustomerLookupResponseFast, encode_lookup_response, CustomerLookupResponse),
+    ],
+    ids=["checkout", "order", "customer_lookup"],
+)
+def test_response_mirror_encodes_like_pydantic(fixture, fast_type, encode, model):
+    fast = json.loads(encode(msgspec.convert(fixture, type=fast_type)))
+    documented = model.model_validate(fixture).model_dump(mode="json")
+    assert fast == documented
+
+
+@pytest.mark.parametrize(
+    ("body", "fast_type", "model"),
+    [
+        (
+            {
+                "id": "evt_1",
+                "type": "checkout.session.completed",
+                "data": {"object": {"id": "cs_test_a1", "amount_total": 2999}},
+                "created": 1705314600,
+                "livemode": False,
+            },
+            webhook_fast.StripeWebhookEvent,
+            StripeWebhookEvent,
+        ),
+        (
+            {"event_type": "esim.activated", "iccid": "8910300000000000001", "status": "active"},
+            webhook_fast.ESIMProviderWebhook,
+            ESIMProviderWebhook,
+        ),
+        (
+            {"event_type": "esim.deleted"},
+            webhook_fast.ESIMProviderWebhook,
+            ESIMProviderWebhook,
+        ),
+    ],
+    ids=["stripe_event", "esim_provider", "esim_provider_defaults"],
+)
+def test_webhook_mirror_decodes_like_pydantic(body, fast_type, model):
+    raw = json.dumps(body).encode()
+    fast = msgspec.to_builtins(msgspec.json.decode(raw, type=fast_type))
+    documented = model.model_validate_json(raw).model_dump(mode="json")
+    assert fast == documented